@@ -0,0 +1,272 @@
+"""
+A2A DNS Cache
+
+This module provides an httpcore network backend that caches hostname
+resolution, so repeated connections to the same agent host skip the
+DNS round trip.
+"""
+
+import ssl
+import time
+import socket
+import asyncio
+import ipaddress
+from contextlib import contextmanager
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import httpcore
+import httpx
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DNS_TTL = 60.0
+
+# httpcore errors and the httpx errors callers expect in their place,
+# most specific first
+_HTTPCORE_EXCEPTIONS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextmanager
+def _map_httpcore_exceptions(request: httpx.Request) -> Iterator[None]:
+    """Re-raise httpcore errors as their httpx equivalents"""
+    try:
+        yield
+    except Exception as exc:
+        for core_exc, httpx_exc in _HTTPCORE_EXCEPTIONS:
+            if isinstance(exc, core_exc):
+                raise httpx_exc(str(exc), request=request) from exc
+        raise
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves hostnames once per TTL
+    
+    Every resolved address is kept and tried in turn, so an unreachable
+    first address (e.g. ::1 for an agent bound to 0.0.0.0) falls back to
+    the next one. Connections are opened to the cached address while TLS
+    still uses the original hostname for SNI and certificate checks,
+    since httpcore passes the request host to start_tls separately.
+    """
+    
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        """
+        Initialize caching resolver backend
+        
+        Args:
+            ttl: Seconds to keep a resolved address
+            backend: Backend used to open connections
+        """
+        self.ttl = ttl
+        self._backend = backend or httpcore.AnyIOBackend()
+        # (host, port) -> (resolved_at, addresses in connection order)
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+    
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """
+        Resolve a hostname, using the cache when fresh
+        
+        Args:
+            host: Hostname or IP literal
+            port: Target port
+        
+        Returns:
+            IP addresses to try, in order
+        """
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        # getaddrinfo already orders by preference; drop duplicates only
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[key] = (time.monotonic(), addresses)
+        logger.debug(f"Resolved {host} to {addresses}")
+        return addresses
+    
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection to the first reachable cached address for host"""
+        addresses = await self._resolve(host, port)
+        error: Optional[Exception] = None
+        
+        for index, address in enumerate(addresses):
+            try:
+                stream = await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options
+                )
+            except Exception as e:
+                error = e
+                continue
+            
+            # Try the address that worked first from now on
+            if index:
+                addresses.insert(0, addresses.pop(index))
+            return stream
+        
+        # Every address failed and may be stale; resolve again next time
+        self._cache.pop((host, port), None)
+        raise error
+    
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable] = None
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a unix socket connection"""
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+    
+    async def sleep(self, seconds: float):
+        """Sleep using the wrapped backend"""
+        await self._backend.sleep(seconds)
+    
+    def clear(self):
+        """Drop all cached addresses"""
+        self._cache.clear()
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """httpx response body backed by an httpcore response stream"""
+    
+    def __init__(self, stream: AsyncIterator[bytes], request: httpx.Request):
+        """
+        Initialize response stream
+        
+        Args:
+            stream: httpcore response stream
+            request: Request the response belongs to
+        """
+        self._stream = stream
+        self._request = request
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_exceptions(self._request):
+            async for part in self._stream:
+                yield part
+    
+    async def aclose(self):
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class CachingDNSTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport whose connection pool resolves hosts through a DNS cache
+    
+    Owns an httpcore connection pool built with CachingResolverBackend,
+    since httpx.AsyncHTTPTransport has no public hook for the pool's
+    network backend.
+    """
+    
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DNS_TTL,
+        verify: Union[bool, str, ssl.SSLContext] = True,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None
+    ):
+        """
+        Initialize caching DNS transport
+        
+        Args:
+            ttl: Seconds to keep resolved addresses
+            verify: SSL verification flag, CA bundle path or SSL context
+            http2: Enable HTTP/2 negotiation
+            limits: Connection pool limits
+        """
+        limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self.resolver = CachingResolverBackend(ttl)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify, http2=http2),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=self.resolver
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the caching connection pool"""
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        with _map_httpcore_exceptions(request):
+            core_response = await self._pool.handle_async_request(core_request)
+        
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_ResponseStream(core_response.stream, request),
+            extensions=core_response.extensions
+        )
+    
+    async def aclose(self):
+        """Close the connection pool"""
+        await self._pool.aclose()
+
+
+def caching_transport(
+    ttl: float = DEFAULT_DNS_TTL,
+    verify: Union[bool, str, ssl.SSLContext] = True,
+    http2: bool = False,
+    limits: Optional[httpx.Limits] = None
+) -> CachingDNSTransport:
+    """
+    Build an httpx transport whose connection pool uses a DNS cache
+    
+    Args:
+        ttl: Seconds to keep resolved addresses
+        verify: SSL verification flag, CA bundle path or SSL context
+        http2: Enable HTTP/2 negotiation
+        limits: Connection pool limits
+    
+    Returns:
+        Configured async transport
+    """
+    return CachingDNSTransport(ttl, verify=verify, http2=http2, limits=limits)
@@ -0,0 +1,33 @@
+"""
+A2A Event Loop Setup
+
+This module selects the asyncio event loop implementation used by
+agent servers and clients.
+"""
+
+import asyncio
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop policy when it is available
+    
+    Must be called before the event loop is created (e.g. before
+    asyncio.run). Falls back to the default loop if uvloop is not
+    installed, such as on Windows.
+    
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using default asyncio loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed uvloop event loop policy")
+    return True
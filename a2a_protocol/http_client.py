@@ -0,0 +1,77 @@
+"""
+A2A Shared HTTP Client
+
+This module provides the process-wide httpx clients used for outbound
+A2A protocol requests, so all handlers share connection pools.
+
+Task requests use the data pool. Cancellations and status queries use
+a separate control pool, so a long-running analysis upload to an agent
+never holds up a cancel sent to the same agent.
+"""
+
+import asyncio
+from typing import Dict, Tuple
+import httpx
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+
+DATA_POOL = "data"
+CONTROL_POOL = "control"
+
+_POOL_LIMITS = {
+    DATA_POOL: httpx.Limits(
+        max_connections=200,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0
+    ),
+    CONTROL_POOL: httpx.Limits(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=30.0
+    )
+}
+
+# pool name -> (client, event loop it was created on)
+_clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+async def get_http_client(pool: str = DATA_POOL) -> httpx.AsyncClient:
+    """
+    Get a shared HTTP client, creating it on first use
+    
+    The client's connections are bound to the event loop that created
+    them, so a new client is built when called from a different loop.
+    
+    Args:
+        pool: DATA_POOL for task traffic, CONTROL_POOL for cancel/status
+    
+    Returns:
+        Shared httpx async client
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(pool)
+    if entry is None or entry[0].is_closed or entry[1] is not loop:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            http2=True,
+            limits=_POOL_LIMITS[pool]
+        )
+        _clients[pool] = (client, loop)
+        logger.debug(f"Created shared A2A HTTP client ({pool} pool)")
+        return client
+    
+    return entry[0]
+
+
+async def close_http_client():
+    """Close all shared HTTP clients"""
+    entries = list(_clients.items())
+    _clients.clear()
+    
+    for pool, (client, _) in entries:
+        if not client.is_closed:
+            await client.aclose()
+            logger.debug(f"Closed shared A2A HTTP client ({pool} pool)")
@@ -85,6 +85,7 @@ class AgentInfo(BaseModel):
     endpoint: str = Field(description="Agent endpoint URL")
     status: str = Field(default="active", description="Agent status")
     health_check_endpoint: Optional[str] = Field(default=None, description="Health check endpoint")
+    serialization: str = Field(default="json", description="Wire serialization format (json, msgpack)")
 
 
 class AnalysisResult(BaseModel):
@@ -0,0 +1,33 @@
+"""
+A2A ORJSON Response
+
+This module provides an orjson-backed JSON response class for A2A
+FastAPI endpoints.
+"""
+
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+    
+    Returning this response directly from an endpoint bypasses FastAPI's
+    jsonable_encoder and stdlib json serialization.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        """
+        Render content as JSON bytes
+        
+        Args:
+            content: Response content
+            
+        Returns:
+            Serialized JSON bytes
+        """
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
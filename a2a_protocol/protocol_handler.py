@@ -6,14 +6,18 @@ for agent-to-agent communication.
 """
 
 import json
-import uuid
+import secrets
+import time
 import asyncio
-from typing import Dict, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, Any, List, Mapping, Optional, Union
+from types import MappingProxyType
 import httpx
+import orjson
+from pydantic import ValidationError
+from .http_client import CONTROL_POOL, get_http_client
+from .serialization import content_type_for, decode_body, encode_body, is_msgpack
 from .message_schema import (
-    A2AMessage, TaskRequest, TaskResponse, TaskStatusQuery, 
-    TaskCancellation, Notification, TaskStatus, AnalysisResult
+    A2AMessage, TaskResponse, Notification, TaskStatus, AnalysisResult
 )
 from utils.logger import get_logger
 
@@ -33,24 +37,32 @@ class A2AProtocolHandler:
     with support for synchronous and asynchronous operations.
     """
     
-    def __init__(self, agent_id: str, timeout: int = 30):
+    def __init__(self, agent_id: str, timeout: int = 30, trusted_peers: bool = False):
         """
         Initialize A2A protocol handler
         
         Args:
             agent_id: Unique identifier for this agent
             timeout: Request timeout in seconds
+            trusted_peers: Skip validation of responses from peer agents
         """
         self.agent_id = agent_id
         self.timeout = timeout
+        self.trusted_peers = trusted_peers
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
-        self.client = httpx.AsyncClient(timeout=timeout)
+        
+        # Outbound request envelopes; per-call id/params are merged in
+        self._task_template = {"jsonrpc": "2.0", "method": "analyze_code"}
+        self._status_template = {"jsonrpc": "2.0", "method": "get_task_status"}
+        self._cancel_template = {"jsonrpc": "2.0", "method": "cancel_task"}
+        self._cancel_batch_template = {"jsonrpc": "2.0", "method": "cancel_tasks"}
         
     async def send_task_request(
         self, 
         target_agent_endpoint: str, 
         task_params: Dict[str, Any],
-        task_id: Optional[str] = None
+        task_id: Optional[str] = None,
+        serialization: str = "json"
     ) -> TaskResponse:
         """
         Send a task request to a remote agent
@@ -59,37 +71,39 @@ class A2AProtocolHandler:
             target_agent_endpoint: Endpoint URL of the target agent
             task_params: Task parameters
             task_id: Optional task ID, generates one if not provided
+            serialization: Wire format advertised by the target agent
             
         Returns:
             TaskResponse from the remote agent
         """
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = secrets.token_hex(8)
             
-        request = TaskRequest(
-            id=task_id,
-            method="analyze_code",
-            params=task_params
-        )
+        payload = {**self._task_template, "id": task_id, "params": task_params}
+        content_type = content_type_for(serialization)
         
         try:
             logger.info(f"Sending task request {task_id} to {target_agent_endpoint}")
             
-            response = await self.client.post(
+            client = await get_http_client()
+            response = await client.post(
                 target_agent_endpoint,
-                json=request.dict(),
-                headers={"Content-Type": "application/json"}
+                content=encode_body(payload, content_type),
+                headers={"Content-Type": content_type, "Accept": content_type},
+                timeout=self.timeout
             )
             response.raise_for_status()
             
-            response_data = response.json()
-            task_response = TaskResponse(**response_data)
+            task_response = self._decode_task_response(
+                response.content,
+                response.headers.get("Content-Type", content_type)
+            )
             
             # Track active task
             self.active_tasks[task_id] = {
                 "status": TaskStatus.RUNNING,
                 "endpoint": target_agent_endpoint,
-                "created_at": datetime.utcnow(),
+                "created_at_ns": time.monotonic_ns(),
                 "response": task_response
             }
             
@@ -99,10 +113,33 @@ class A2AProtocolHandler:
         except httpx.HTTPError as e:
             logger.error(f"HTTP error sending task request {task_id}: {e}")
             raise A2AProtocolError(f"HTTP error: {e}")
+        except ValidationError as e:
+            logger.error(f"Invalid response for task request {task_id}: {e}")
+            raise A2AProtocolError(f"Invalid response: {e}")
         except Exception as e:
             logger.error(f"Error sending task request {task_id}: {e}")
             raise A2AProtocolError(f"Request failed: {e}")
     
+    def _decode_task_response(self, body: bytes, content_type: str) -> TaskResponse:
+        """
+        Decode a task response body
+        
+        JSON from untrusted peers is parsed and validated in a single
+        pydantic-core pass; trusted peers skip validation entirely.
+        
+        Args:
+            body: Raw response body
+            content_type: Response content type
+            
+        Returns:
+            Decoded task response
+        """
+        if self.trusted_peers:
+            return TaskResponse.model_construct(**decode_body(body, content_type))
+        if is_msgpack(content_type):
+            return TaskResponse.model_validate(decode_body(body, content_type))
+        return TaskResponse.model_validate_json(body)
+    
     async def query_task_status(
         self, 
         target_agent_endpoint: str, 
@@ -118,21 +155,19 @@ class A2AProtocolHandler:
         Returns:
             Task status information
         """
-        request = TaskStatusQuery(
-            id=str(uuid.uuid4()),
-            method="get_task_status",
-            params={"task_id": task_id}
-        )
+        payload = {**self._status_template, "id": secrets.token_hex(8), "params": {"task_id": task_id}}
         
         try:
-            response = await self.client.post(
+            client = await get_http_client(CONTROL_POOL)
+            response = await client.post(
                 target_agent_endpoint,
-                json=request.dict(),
-                headers={"Content-Type": "application/json"}
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
             )
             response.raise_for_status()
             
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             return response_data.get("result", {})
             
         except Exception as e:
@@ -154,17 +189,15 @@ class A2AProtocolHandler:
         Returns:
             True if cancellation was successful
         """
-        request = TaskCancellation(
-            id=str(uuid.uuid4()),
-            method="cancel_task",
-            params={"task_id": task_id}
-        )
+        payload = {**self._cancel_template, "id": secrets.token_hex(8), "params": {"task_id": task_id}}
         
         try:
-            response = await self.client.post(
+            client = await get_http_client(CONTROL_POOL)
+            response = await client.post(
                 target_agent_endpoint,
-                json=request.dict(),
-                headers={"Content-Type": "application/json"}
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
             )
             response.raise_for_status()
             
@@ -178,6 +211,48 @@ class A2AProtocolHandler:
             logger.error(f"Error cancelling task {task_id}: {e}")
             return False
     
+    async def cancel_tasks(
+        self, 
+        target_agent_endpoint: str, 
+        task_ids: List[str]
+    ) -> bool:
+        """
+        Cancel several tasks on one agent in a single request
+        
+        Args:
+            target_agent_endpoint: Endpoint URL of the target agent
+            task_ids: Task IDs to cancel
+            
+        Returns:
+            True if the agent accepted the batch; False if it failed or
+            does not support batch cancellation
+        """
+        payload = {**self._cancel_batch_template, "id": secrets.token_hex(8), "params": {"task_ids": task_ids}}
+        
+        try:
+            client = await get_http_client(CONTROL_POOL)
+            response = await client.post(
+                target_agent_endpoint,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            if orjson.loads(response.content).get("error"):
+                return False
+            
+            # Update local task status
+            for task_id in task_ids:
+                if task_id in self.active_tasks:
+                    self.active_tasks[task_id]["status"] = TaskStatus.CANCELLED
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error cancelling {len(task_ids)} tasks at {target_agent_endpoint}: {e}")
+            return False
+    
     def create_notification(
         self, 
         method: str, 
@@ -195,23 +270,27 @@ class A2AProtocolHandler:
         """
         return Notification(method=method, params=params)
     
-    def parse_message(self, message_data: Dict[str, Any]) -> Union[A2AMessage, Notification]:
+    def parse_message(
+        self, 
+        message_data: Dict[str, Any], 
+        trusted: bool = False
+    ) -> Union[A2AMessage, Notification]:
         """
         Parse incoming A2A message
         
         Args:
             message_data: Raw message data
+            trusted: Build the message without validation
             
         Returns:
             Parsed A2A message or notification
         """
         try:
-            if "id" in message_data:
-                # This is a request/response message
-                return A2AMessage(**message_data)
-            else:
-                # This is a notification
-                return Notification(**message_data)
+            # Messages without an id are notifications
+            model = A2AMessage if "id" in message_data else Notification
+            if trusted:
+                return model.model_construct(**message_data)
+            return model.model_validate(message_data)
         except Exception as e:
             logger.error(f"Error parsing message: {e}")
             raise A2AProtocolError(f"Message parsing failed: {e}")
@@ -263,15 +342,15 @@ class A2AProtocolHandler:
     
     async def close(self):
         """Close the protocol handler and cleanup resources"""
-        await self.client.aclose()
+        # The shared HTTP client is closed once at process shutdown
         self.active_tasks.clear()
     
-    def get_active_tasks(self) -> Dict[str, Dict[str, Any]]:
-        """Get all active tasks"""
-        return self.active_tasks.copy()
+    def get_active_tasks(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of all active tasks"""
+        return MappingProxyType(self.active_tasks)
     
     def update_task_status(self, task_id: str, status: TaskStatus):
         """Update local task status"""
         if task_id in self.active_tasks:
             self.active_tasks[task_id]["status"] = status
-            self.active_tasks[task_id]["updated_at"] = datetime.utcnow()
+            self.active_tasks[task_id]["updated_at_ns"] = time.monotonic_ns()
@@ -0,0 +1,80 @@
+"""
+A2A Wire Serialization
+
+This module implements body encoding for A2A protocol messages.
+JSON is the default; agents that advertise msgpack in the registry
+exchange JSON-RPC payloads as msgpack instead.
+"""
+
+from typing import Any, Optional
+import msgspec
+import orjson
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+SERIALIZATION_CONTENT_TYPES = {
+    "json": JSON_CONTENT_TYPE,
+    "msgpack": MSGPACK_CONTENT_TYPE
+}
+
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def content_type_for(serialization: str) -> str:
+    """
+    Get the content type for a serialization format
+    
+    Args:
+        serialization: Serialization format name (json, msgpack)
+        
+    Returns:
+        Content type header value
+    """
+    return SERIALIZATION_CONTENT_TYPES.get(serialization, JSON_CONTENT_TYPE)
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """
+    Check whether a content type header denotes msgpack
+    
+    Args:
+        content_type: Content type header value
+        
+    Returns:
+        True if the body is msgpack encoded
+    """
+    return bool(content_type) and content_type.split(";", 1)[0].strip() == MSGPACK_CONTENT_TYPE
+
+
+def encode_body(data: Any, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """
+    Encode a message body
+    
+    Args:
+        data: Message data
+        content_type: Target content type
+        
+    Returns:
+        Encoded body bytes
+    """
+    if is_msgpack(content_type):
+        return _msgpack_encoder.encode(data)
+    return orjson.dumps(data)
+
+
+def decode_body(body: bytes, content_type: Optional[str] = JSON_CONTENT_TYPE) -> Any:
+    """
+    Decode a message body
+    
+    Args:
+        body: Raw body bytes
+        content_type: Content type of the body
+        
+    Returns:
+        Decoded message data
+    """
+    if is_msgpack(content_type):
+        return _msgpack_decoder.decode(body)
+    return orjson.loads(body)
@@ -6,23 +6,47 @@ updates in the A2A protocol.
 """
 
 import asyncio
-import json
+import secrets
+import time
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, Set, AsyncGenerator
 from datetime import datetime
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 from .message_schema import Notification, TaskStatus
+from .orjson_response import ORJSONResponse
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# [epoch second, ISO string] for the most recently formatted second
+_ts_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Get the current UTC time as an ISO string, cached per second"""
+    t = int(time.time())
+    cache = _ts_cache
+    if cache[0] != t:
+        cache[0] = t
+        cache[1] = datetime.utcfromtimestamp(t).isoformat()
+    return cache[1]
+
 
 class SSEError(Exception):
     """Custom exception for SSE-related errors"""
     pass
 
 
+@dataclass(slots=True)
+class ConnectionState:
+    """Per-connection SSE state"""
+    queue: asyncio.Queue
+    subscribed: Set[str] = field(default_factory=set)
+
+
 class A2ASSEHandler:
     """
     Handles Server-Sent Events for real-time streaming updates
@@ -31,6 +55,17 @@ class A2ASSEHandler:
     and notifications in the A2A protocol.
     """
     
+    # Pending events per connection before a slow consumer is dropped
+    QUEUE_MAXSIZE = 256
+    
+    # Window in seconds over which task updates are coalesced per task
+    TASK_UPDATE_WINDOW = 0.05
+    
+    # Pre-built frames for the fixed-shape connection and keepalive events
+    _CONNECTED_EVENT_TMPL = b'event: connected\ndata: {"connection_id":%s}\n\n'
+    _PING_PREFIX = b'event: ping\ndata: {"timestamp":"'
+    _PING_SUFFIX = b'"}\n\n'
+    
     def __init__(self, app: FastAPI, sse_path: str = "/sse"):
         """
         Initialize A2A SSE handler
@@ -41,14 +76,17 @@ class A2ASSEHandler:
         """
         self.app = app
         self.sse_path = sse_path
-        self.active_connections: Set[str] = set()
-        self.event_queues: Dict[str, asyncio.Queue] = {}
+        self.connections: Dict[str, ConnectionState] = {}
         self.subscribers: Dict[str, Set[str]] = {}  # event_type -> set of connection_ids
         
+        # Latest pending task update per task_id, flushed once per window
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        
         # Register SSE endpoints
         self.app.get(f"{sse_path}/stream")(self.stream_events)
-        self.app.post(f"{sse_path}/subscribe")(self.subscribe_to_events)
-        self.app.post(f"{sse_path}/unsubscribe")(self.unsubscribe_from_events)
+        self.app.post(f"{sse_path}/subscribe", response_class=ORJSONResponse)(self.subscribe_to_events)
+        self.app.post(f"{sse_path}/unsubscribe", response_class=ORJSONResponse)(self.unsubscribe_from_events)
     
     async def stream_events(self, request: Request, connection_id: Optional[str] = None):
         """
@@ -62,34 +100,36 @@ class A2ASSEHandler:
             Streaming response with events
         """
         if connection_id is None:
-            connection_id = f"conn_{datetime.utcnow().timestamp()}"
+            connection_id = f"conn_{secrets.token_hex(6)}"
         
-        self.active_connections.add(connection_id)
-        self.event_queues[connection_id] = asyncio.Queue()
+        state = ConnectionState(queue=asyncio.Queue(maxsize=self.QUEUE_MAXSIZE))
+        self.connections[connection_id] = state
         
         logger.info(f"SSE connection established: {connection_id}")
         
-        async def event_generator() -> AsyncGenerator[str, None]:
+        async def event_generator() -> AsyncGenerator[bytes, None]:
             try:
                 # Send connection established event
-                yield self._format_sse_event("connected", {"connection_id": connection_id})
+                yield self._CONNECTED_EVENT_TMPL % orjson.dumps(connection_id)
                 
                 while True:
                     try:
-                        # Check if client disconnected
+                        # Check if client disconnected or was dropped
+                        if connection_id not in self.connections:
+                            break
                         if await request.is_disconnected():
                             break
                         
-                        # Wait for events with timeout
+                        # Wait for pre-formatted events with timeout
                         try:
-                            event_data = await asyncio.wait_for(
-                                self.event_queues[connection_id].get(),
+                            event_bytes = await asyncio.wait_for(
+                                state.queue.get(),
                                 timeout=30.0
                             )
-                            yield self._format_sse_event("message", event_data)
+                            yield event_bytes
                         except asyncio.TimeoutError:
                             # Send keepalive ping
-                            yield self._format_sse_event("ping", {"timestamp": datetime.utcnow().isoformat()})
+                            yield self._PING_PREFIX + _now_iso().encode() + self._PING_SUFFIX
                             continue
                             
                     except Exception as e:
@@ -106,7 +146,7 @@ class A2ASSEHandler:
         
         return EventSourceResponse(event_generator())
     
-    async def subscribe_to_events(self, request: Request):
+    async def subscribe_to_events(self, request: Request) -> ORJSONResponse:
         """Subscribe to specific event types"""
         try:
             data = await request.json()
@@ -114,25 +154,27 @@ class A2ASSEHandler:
             event_types = data.get("event_types", [])
             
             if not connection_id:
-                return {"error": "Missing connection_id"}
+                return ORJSONResponse({"error": "Missing connection_id"})
             
-            if connection_id not in self.active_connections:
-                return {"error": "Connection not found"}
+            state = self.connections.get(connection_id)
+            if state is None:
+                return ORJSONResponse({"error": "Connection not found"})
             
             # Subscribe to event types
             for event_type in event_types:
                 if event_type not in self.subscribers:
                     self.subscribers[event_type] = set()
                 self.subscribers[event_type].add(connection_id)
+                state.subscribed.add(event_type)
             
             logger.info(f"Connection {connection_id} subscribed to events: {event_types}")
-            return {"status": "success", "subscribed_to": event_types}
+            return ORJSONResponse({"status": "success", "subscribed_to": event_types})
             
         except Exception as e:
             logger.error(f"Error subscribing to events: {e}")
-            return {"error": str(e)}
+            return ORJSONResponse({"error": str(e)})
     
-    async def unsubscribe_from_events(self, request: Request):
+    async def unsubscribe_from_events(self, request: Request) -> ORJSONResponse:
         """Unsubscribe from specific event types"""
         try:
             data = await request.json()
@@ -140,19 +182,22 @@ class A2ASSEHandler:
             event_types = data.get("event_types", [])
             
             if not connection_id:
-                return {"error": "Missing connection_id"}
+                return ORJSONResponse({"error": "Missing connection_id"})
             
             # Unsubscribe from event types
+            state = self.connections.get(connection_id)
             for event_type in event_types:
                 if event_type in self.subscribers:
                     self.subscribers[event_type].discard(connection_id)
+                if state is not None:
+                    state.subscribed.discard(event_type)
             
             logger.info(f"Connection {connection_id} unsubscribed from events: {event_types}")
-            return {"status": "success", "unsubscribed_from": event_types}
+            return ORJSONResponse({"status": "success", "unsubscribed_from": event_types})
             
         except Exception as e:
             logger.error(f"Error unsubscribing from events: {e}")
-            return {"error": str(e)}
+            return ORJSONResponse({"error": str(e)})
     
     async def broadcast_event(self, event_type: str, event_data: Dict[str, Any]):
         """
@@ -168,17 +213,14 @@ class A2ASSEHandler:
         message = {
             "type": event_type,
             "data": event_data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
-        # Send to all subscribers of this event type
+        # Serialize once and share the frame with every subscriber
+        event_bytes = self._format_sse_event("message", message)
+        
         for connection_id in self.subscribers[event_type].copy():
-            if connection_id in self.active_connections:
-                try:
-                    await self.event_queues[connection_id].put(message)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {connection_id}: {e}")
-                    self._cleanup_connection(connection_id)
+            self._safe_put(connection_id, event_bytes)
     
     async def send_to_connection(
         self, 
@@ -194,18 +236,38 @@ class A2ASSEHandler:
             event_type: Type of event
             event_data: Event data
         """
-        if connection_id not in self.active_connections:
+        if connection_id not in self.connections:
             logger.warning(f"Connection {connection_id} not found")
             return
         
         message = {
             "type": event_type,
             "data": event_data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
+        self._safe_put(connection_id, self._format_sse_event("message", message))
+    
+    def _safe_put(self, connection_id: str, event_bytes: bytes):
+        """
+        Enqueue a formatted event without blocking
+        
+        A connection whose queue is full is dropped so that one slow
+        consumer never holds up the rest of a broadcast.
+        
+        Args:
+            connection_id: Target connection ID
+            event_bytes: Formatted SSE event
+        """
+        state = self.connections.get(connection_id)
+        if state is None:
+            return
+        
         try:
-            await self.event_queues[connection_id].put(message)
+            state.queue.put_nowait(event_bytes)
+        except asyncio.QueueFull:
+            logger.warning(f"Dropping slow SSE consumer {connection_id}")
+            self._cleanup_connection(connection_id)
         except Exception as e:
             logger.error(f"Error sending to connection {connection_id}: {e}")
             self._cleanup_connection(connection_id)
@@ -219,18 +281,32 @@ class A2ASSEHandler:
         """
         Broadcast task update event
         
+        Updates are coalesced: only the latest status per task within
+        TASK_UPDATE_WINDOW is sent to subscribers.
+        
         Args:
             task_id: Task identifier
             status: Task status
             result: Optional task result
         """
-        event_data = {
+        self._pending_updates[task_id] = {
             "task_id": task_id,
             "status": status.value,
             "result": result
         }
         
-        await self.broadcast_event("task_update", event_data)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_updates())
+    
+    async def _flush_updates(self):
+        """Broadcast the coalesced task updates after the window closes"""
+        await asyncio.sleep(self.TASK_UPDATE_WINDOW)
+        
+        pending = self._pending_updates
+        self._pending_updates = {}
+        
+        for event_data in pending.values():
+            await self.broadcast_event("task_update", event_data)
     
     async def broadcast_task_completion(
         self, 
@@ -264,21 +340,30 @@ class A2ASSEHandler:
             "error": error
         }
         
+        # Send any coalesced update now so the error is the last event
+        # subscribers see for this task
+        pending_update = self._pending_updates.pop(task_id, None)
+        if pending_update is not None:
+            await self.broadcast_event("task_update", pending_update)
+        
         await self.broadcast_event("task_error", event_data)
     
-    def _format_sse_event(self, event_type: str, data: Dict[str, Any]) -> str:
+    def _format_sse_event(self, event_type: str, data: Dict[str, Any]) -> bytes:
         """
         Format data as SSE event
         
+        Naive datetimes in the payload are serialized by orjson as UTC,
+        so callers can pass ``datetime`` objects without formatting them.
+        
         Args:
             event_type: Event type
             data: Event data
             
         Returns:
-            Formatted SSE event string
+            Formatted SSE event bytes
         """
-        event_json = json.dumps(data)
-        return f"event: {event_type}\ndata: {event_json}\n\n"
+        payload = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
+        return b"event: " + event_type.encode() + b"\ndata: " + payload + b"\n\n"
     
     def _cleanup_connection(self, connection_id: str):
         """
@@ -287,23 +372,22 @@ class A2ASSEHandler:
         Args:
             connection_id: Connection identifier
         """
-        # Remove from active connections
-        self.active_connections.discard(connection_id)
-        
-        # Remove from event queues
-        if connection_id in self.event_queues:
-            del self.event_queues[connection_id]
+        state = self.connections.pop(connection_id, None)
+        if state is None:
+            return
         
-        # Remove from all subscriber lists
-        for event_type in self.subscribers:
-            self.subscribers[event_type].discard(connection_id)
+        # Remove from the subscriber lists this connection joined
+        for event_type in state.subscribed:
+            subscribers = self.subscribers.get(event_type)
+            if subscribers is not None:
+                subscribers.discard(connection_id)
         
         logger.info(f"Cleaned up SSE connection: {connection_id}")
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get SSE connection statistics"""
         return {
-            "active_connections": len(self.active_connections),
+            "active_connections": len(self.connections),
             "total_event_types": len(self.subscribers),
             "subscribers_per_type": {
                 event_type: len(subscribers) 
@@ -313,7 +397,11 @@ class A2ASSEHandler:
     
     async def close_all_connections(self):
         """Close all active SSE connections"""
-        for connection_id in list(self.active_connections):
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._pending_updates.clear()
+        
+        for connection_id in list(self.connections):
             self._cleanup_connection(connection_id)
         
         logger.info("All SSE connections closed")
@@ -6,26 +6,84 @@ communication between agents.
 """
 
 import ssl
+import time
+import random
 import asyncio
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import httpx
+import orjson
 from .message_schema import A2AMessage, TaskResponse
+from .dns_cache import caching_transport
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Gateway errors that are safe to retry
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+# Circuit breaker states
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Headers sent with every request; callers' extra headers are layered on top
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "User-Agent": "A2A-Protocol-Client/1.0",
+    "Accept": "application/json"
+})
+_NOTIFICATION_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "User-Agent": "A2A-Protocol-Client/1.0"
+})
+
 
 class TransportError(Exception):
     """Custom exception for transport layer errors"""
     pass
 
 
+class CountingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport wrapper that counts requests in flight
+    
+    Gives get_stats a stable O(1) figure without reaching into
+    httpx's private connection pool.
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        """
+        Initialize counting transport
+        
+        Args:
+            transport: Transport that actually sends requests
+        """
+        self._transport = transport
+        self.active_requests = 0
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the wrapped transport"""
+        self.active_requests += 1
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self.active_requests -= 1
+    
+    async def aclose(self):
+        """Close the wrapped transport"""
+        await self._transport.aclose()
+
+
 class A2ATransport:
     """
     HTTPS transport layer for A2A protocol communication
     
     Handles secure communication between agents with proper
-    error handling and retry logic.
+    error handling and retry logic. HTTP/2 is negotiated via ALPN, so
+    concurrent requests to an h2-capable agent (e.g. served by hypercorn
+    or behind nginx) share one connection; other peers fall back to
+    HTTP/1.1 automatically.
     """
     
     def __init__(
@@ -33,7 +91,10 @@ class A2ATransport:
         timeout: int = 30, 
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 20,
+        http2: bool = True
     ):
         """
         Initialize A2A transport layer
@@ -43,11 +104,28 @@ class A2ATransport:
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open
+            http2: Whether to offer HTTP/2 to endpoints that support it
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.verify_ssl = verify_ssl
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2
+        self.max_backoff = 30.0
+        
+        # Health check results per endpoint: (checked_at, healthy)
+        self._health_cache: Dict[str, tuple[float, bool]] = {}
+        self._health_locks: Dict[str, asyncio.Lock] = {}
+        self._health_ttl = 10.0
+        
+        # Circuit breaker per endpoint: state, consecutive failures, opened_at
+        self._breakers: Dict[str, Dict[str, Any]] = {}
+        self.breaker_threshold = 5
+        self.breaker_cooldown = 30.0
         
         # Configure SSL context
         self.ssl_context = ssl.create_default_context()
@@ -55,15 +133,22 @@ class A2ATransport:
             self.ssl_context.check_hostname = False
             self.ssl_context.verify_mode = ssl.CERT_NONE
         
-        # Create HTTP client with custom configuration
+        # Create HTTP client with custom configuration; the transport
+        # caches DNS lookups so fan-out to known hosts skips resolution
+        self._transport = CountingTransport(
+            caching_transport(
+                http2=http2,
+                verify=self.ssl_context if verify_ssl else False,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max_keepalive_connections,
+                    max_connections=max_connections,
+                    keepalive_expiry=15.0
+                )
+            )
+        )
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
-            verify=self.ssl_context if verify_ssl else False,
-            limits=httpx.Limits(
-                max_keepalive_connections=20,
-                max_connections=100,
-                keepalive_expiry=30.0
-            )
+            transport=self._transport
         )
     
     async def send_message(
@@ -83,69 +168,171 @@ class A2ATransport:
         Returns:
             Response from the endpoint
         """
-        if headers is None:
-            headers = {}
-        
-        headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "A2A-Protocol-Client/1.0",
-            "Accept": "application/json"
-        })
-        
-        message_data = message.dict()
+        request_headers = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+        message_body = message.model_dump_json().encode()
         
         for attempt in range(self.max_retries + 1):
+            # Fail fast while the endpoint's breaker is open
+            self._check_breaker(endpoint)
+            
             try:
                 logger.debug(f"Sending message to {endpoint} (attempt {attempt + 1})")
                 
                 response = await self.client.post(
                     endpoint,
-                    json=message_data,
-                    headers=headers
+                    content=message_body,
+                    headers=request_headers
                 )
                 
+                # Any non-5xx answer means the endpoint is reachable
+                if response.status_code >= 500:
+                    self._record_failure(endpoint)
+                else:
+                    self._record_success(endpoint)
+                
                 # Check for HTTP errors
                 if response.status_code >= 400:
                     error_msg = f"HTTP {response.status_code}: {response.text}"
                     logger.error(f"HTTP error: {error_msg}")
                     
-                    if response.status_code >= 500 and attempt < self.max_retries:
-                        # Retry on server errors
-                        await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                        # Retry on gateway errors, honoring Retry-After
+                        await asyncio.sleep(self._retry_delay(attempt, response))
                         continue
                     else:
                         raise TransportError(error_msg)
                 
-                # Parse response
-                response_data = response.json()
-                return TaskResponse(**response_data)
+                # Parse and validate response bytes directly
+                return TaskResponse.model_validate_json(response.content)
+                
+            except TransportError:
+                raise
                 
             except httpx.TimeoutException:
+                self._record_failure(endpoint)
                 logger.warning(f"Timeout sending message to {endpoint} (attempt {attempt + 1})")
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    await asyncio.sleep(self._retry_delay(attempt))
                     continue
                 else:
                     raise TransportError("Request timeout after all retries")
                     
             except httpx.ConnectError as e:
+                self._record_failure(endpoint)
                 logger.warning(f"Connection error to {endpoint}: {e}")
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    await asyncio.sleep(self._retry_delay(attempt))
                     continue
                 else:
                     raise TransportError(f"Connection failed: {e}")
                     
             except httpx.RequestError as e:
+                self._record_failure(endpoint)
                 logger.error(f"Request error to {endpoint}: {e}")
                 raise TransportError(f"Request failed: {e}")
                 
             except Exception as e:
                 logger.error(f"Unexpected error sending message to {endpoint}: {e}")
                 raise TransportError(f"Unexpected error: {e}")
+            
+            finally:
+                # A probe that ended without recording an outcome (cancelled,
+                # or failed outside the HTTP error paths) must not leave the
+                # breaker half-open, or no further probe would ever be allowed
+                self._abort_probe(endpoint)
         
         raise TransportError("Max retries exceeded")
     
+    def _check_breaker(self, endpoint: str):
+        """
+        Raise if the circuit breaker for an endpoint is open
+        
+        After the cooldown the breaker moves to half-open and lets a
+        single probe request through; other callers keep failing fast
+        until that probe succeeds or fails.
+        
+        Args:
+            endpoint: Target endpoint URL
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is None or breaker["state"] == BREAKER_CLOSED:
+            return
+        
+        if (breaker["state"] == BREAKER_OPEN and
+                time.monotonic() - breaker["opened_at"] >= self.breaker_cooldown):
+            breaker["state"] = BREAKER_HALF_OPEN
+            logger.info(f"Circuit half-open for {endpoint}, allowing probe")
+            return
+        
+        raise TransportError(f"Circuit open for {endpoint}")
+    
+    def _record_failure(self, endpoint: str):
+        """
+        Record a failed attempt against an endpoint's circuit breaker
+        
+        Args:
+            endpoint: Target endpoint URL
+        """
+        breaker = self._breakers.setdefault(
+            endpoint,
+            {"state": BREAKER_CLOSED, "failures": 0, "opened_at": 0.0}
+        )
+        breaker["failures"] += 1
+        
+        if breaker["state"] == BREAKER_HALF_OPEN or breaker["failures"] >= self.breaker_threshold:
+            if breaker["state"] != BREAKER_OPEN:
+                logger.warning(f"Circuit opened for {endpoint} after {breaker['failures']} failures")
+            breaker["state"] = BREAKER_OPEN
+            breaker["opened_at"] = time.monotonic()
+    
+    def _abort_probe(self, endpoint: str):
+        """
+        Reopen an endpoint's breaker if its half-open probe never finished
+        
+        Args:
+            endpoint: Target endpoint URL
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is not None and breaker["state"] == BREAKER_HALF_OPEN:
+            breaker["state"] = BREAKER_OPEN
+            breaker["opened_at"] = time.monotonic()
+            logger.warning(f"Circuit reopened for {endpoint}, probe did not complete")
+    
+    def _record_success(self, endpoint: str):
+        """
+        Reset an endpoint's circuit breaker after a successful request
+        
+        Args:
+            endpoint: Target endpoint URL
+        """
+        if endpoint in self._breakers:
+            del self._breakers[endpoint]
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Get the delay before the next retry attempt
+        
+        Uses random exponential backoff capped at max_backoff so that
+        concurrent senders do not retry in lockstep.
+        
+        Args:
+            attempt: Zero-based attempt number that just failed
+            response: Failed response, if one was received
+            
+        Returns:
+            Delay in seconds
+        """
+        if response is not None and "retry-after" in response.headers:
+            try:
+                return min(self.max_backoff, max(0.0, float(response.headers["retry-after"])))
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        
+        return min(
+            self.max_backoff,
+            random.uniform(self.retry_delay, self.retry_delay * (2 ** attempt))
+        )
+    
     async def send_notification(
         self, 
         endpoint: str, 
@@ -163,21 +350,15 @@ class A2ATransport:
         Returns:
             True if notification was sent successfully
         """
-        if headers is None:
-            headers = {}
-        
-        headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "A2A-Protocol-Client/1.0"
-        })
+        request_headers = {**_NOTIFICATION_HEADERS, **headers} if headers else _NOTIFICATION_HEADERS
         
         try:
             logger.debug(f"Sending notification to {endpoint}")
             
             response = await self.client.post(
                 endpoint,
-                json=notification_data,
-                headers=headers
+                content=orjson.dumps(notification_data),
+                headers=request_headers
             )
             
             # For notifications, we don't care about the response content
@@ -192,6 +373,34 @@ class A2ATransport:
         """
         Perform health check on endpoint
         
+        Results are cached for a short TTL, and concurrent checks of the
+        same endpoint share a single probe.
+        
+        Args:
+            endpoint: Endpoint to check
+            
+        Returns:
+            True if endpoint is healthy
+        """
+        cached = self._health_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < self._health_ttl:
+            return cached[1]
+        
+        lock = self._health_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            cached = self._health_cache.get(endpoint)
+            if cached and time.monotonic() - cached[0] < self._health_ttl:
+                return cached[1]
+            
+            is_healthy = await self._probe_health(endpoint)
+            self._health_cache[endpoint] = (time.monotonic(), is_healthy)
+            return is_healthy
+    
+    async def _probe_health(self, endpoint: str) -> bool:
+        """
+        Probe the health endpoint over the network
+        
         Args:
             endpoint: Endpoint to check
             
@@ -202,6 +411,7 @@ class A2ATransport:
         
         try:
             response = await self.client.get(health_endpoint, timeout=5.0)
+            logger.debug(f"Health check for {endpoint} negotiated {response.http_version}")
             return response.status_code == 200
             
         except Exception as e:
@@ -211,54 +421,60 @@ class A2ATransport:
     async def batch_send(
         self, 
         requests: list[tuple[str, A2AMessage]],
-        max_concurrent: int = 10
+        max_concurrent: Optional[int] = None
     ) -> list[TaskResponse]:
         """
         Send multiple messages concurrently
         
         Args:
             requests: List of (endpoint, message) tuples
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Maximum concurrent requests, defaults to the
+                keep-alive pool size
             
         Returns:
             List of responses
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        if max_concurrent is None:
+            max_concurrent = self.max_keepalive_connections
         
-        async def send_with_semaphore(endpoint: str, message: A2AMessage) -> TaskResponse:
-            async with semaphore:
-                return await self.send_message(endpoint, message)
+        # Workers share one iterator; next() never awaits, so each
+        # request is taken exactly once without a queue per item
+        pending = iter(enumerate(requests))
+        results: list[Optional[TaskResponse]] = [None] * len(requests)
         
-        tasks = [
-            send_with_semaphore(endpoint, message) 
-            for endpoint, message in requests
-        ]
-        
-        try:
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Separate successful responses from exceptions
-            results = []
-            for response in responses:
-                if isinstance(response, Exception):
-                    logger.error(f"Batch send error: {response}")
+        async def worker():
+            for index, (endpoint, message) in pending:
+                try:
+                    results[index] = await self.send_message(endpoint, message)
+                except Exception as e:
+                    logger.error(f"Batch send error: {e}")
                     # Create error response
-                    error_response = TaskResponse(
+                    results[index] = TaskResponse(
                         id=None,
                         error={
                             "code": -1,
-                            "message": str(response)
+                            "message": str(e)
                         }
                     )
-                    results.append(error_response)
-                else:
-                    results.append(response)
-            
+        
+        # A fixed pool of workers pulls requests as soon as one finishes
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrent, len(requests)))
+        ]
+        
+        try:
+            await asyncio.gather(*workers)
             return results
             
         except Exception as e:
             logger.error(f"Batch send failed: {e}")
             raise TransportError(f"Batch send failed: {e}")
+            
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
     
     async def close(self):
         """Close transport layer and cleanup resources"""
@@ -270,5 +486,12 @@ class A2ATransport:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "verify_ssl": self.verify_ssl,
-            "active_connections": len(self.client._pool._pool) if hasattr(self.client, '_pool') else 0
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "http2": self.http2,
+            "open_circuits": [
+                endpoint for endpoint, breaker in self._breakers.items()
+                if breaker["state"] != BREAKER_CLOSED
+            ],
+            "active_requests": self._transport.active_requests
         }
@@ -5,17 +5,21 @@ This module handles webhook-based asynchronous notifications
 for the A2A protocol.
 """
 
-import json
 import asyncio
 from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from .orjson_response import ORJSONResponse
+from .http_client import get_http_client
 from .message_schema import Notification, TaskStatus
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Event types of the form "notification_<method>" handle a single method
+NOTIFICATION_PREFIX = "notification_"
+
 
 class WebhookError(Exception):
     """Custom exception for webhook-related errors"""
@@ -42,6 +46,8 @@ class A2AWebhookHandler:
         self.webhook_path = webhook_path
         self.app = FastAPI(title="A2A Webhook Handler")
         self.notification_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        # Per-method notification handlers keyed by bare method name
+        self._method_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
         self.server = None
         
         # Register webhook endpoint
@@ -49,7 +55,7 @@ class A2AWebhookHandler:
         self.app.post(f"{webhook_path}/notification")(self.handle_notification)
         self.app.get(f"{webhook_path}/health")(self.health_check)
     
-    async def handle_task_update(self, request: Request) -> JSONResponse:
+    async def handle_task_update(self, request: Request) -> ORJSONResponse:
         """
         Handle task update webhook
         
@@ -60,7 +66,7 @@ class A2AWebhookHandler:
             JSON response
         """
         try:
-            data = await request.json()
+            data = orjson.loads(await request.body())
             logger.info(f"Received task update webhook: {data}")
             
             # Validate webhook data
@@ -77,13 +83,13 @@ class A2AWebhookHandler:
             if "task_update" in self.notification_handlers:
                 await self.notification_handlers["task_update"](data)
             
-            return JSONResponse({"status": "success", "message": "Task update processed"})
+            return ORJSONResponse({"status": "success", "message": "Task update processed"})
             
         except Exception as e:
             logger.error(f"Error handling task update webhook: {e}")
             raise HTTPException(status_code=500, detail=str(e))
     
-    async def handle_notification(self, request: Request) -> JSONResponse:
+    async def handle_notification(self, request: Request) -> ORJSONResponse:
         """
         Handle general notification webhook
         
@@ -94,33 +100,33 @@ class A2AWebhookHandler:
             JSON response
         """
         try:
-            data = await request.json()
+            data = orjson.loads(await request.body())
             logger.info(f"Received notification webhook: {data}")
             
-            # Parse as A2A notification
-            notification = Notification(**data)
-            
-            # Call registered handlers
-            handler_key = f"notification_{notification.method}"
-            if handler_key in self.notification_handlers:
-                await self.notification_handlers[handler_key](data)
-            elif "notification" in self.notification_handlers:
-                await self.notification_handlers["notification"](data)
+            # Look up the handler from the raw method before validating
+            handler = (
+                self._method_handlers.get(data.get("method"))
+                or self.notification_handlers.get("notification")
+            )
+            if handler:
+                # Only validate notifications that a handler will consume
+                Notification.model_validate(data)
+                await handler(data)
             
-            return JSONResponse({"status": "success", "message": "Notification processed"})
+            return ORJSONResponse({"status": "success", "message": "Notification processed"})
             
         except Exception as e:
             logger.error(f"Error handling notification webhook: {e}")
             raise HTTPException(status_code=500, detail=str(e))
     
-    async def health_check(self) -> JSONResponse:
+    async def health_check(self) -> ORJSONResponse:
         """
         Health check endpoint
         
         Returns:
             Health status
         """
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
             "service": "A2A Webhook Handler"
@@ -164,6 +170,8 @@ class A2AWebhookHandler:
             handler: Async handler function
         """
         self.notification_handlers[event_type] = handler
+        if event_type.startswith(NOTIFICATION_PREFIX):
+            self._method_handlers[event_type[len(NOTIFICATION_PREFIX):]] = handler
         logger.info(f"Registered webhook handler for event type: {event_type}")
     
     def unregister_handler(self, event_type: str):
@@ -175,10 +183,17 @@ class A2AWebhookHandler:
         """
         if event_type in self.notification_handlers:
             del self.notification_handlers[event_type]
+            if event_type.startswith(NOTIFICATION_PREFIX):
+                self._method_handlers.pop(event_type[len(NOTIFICATION_PREFIX):], None)
             logger.info(f"Unregistered webhook handler for event type: {event_type}")
     
     async def start_server(self):
-        """Start the webhook server"""
+        """
+        Start the webhook server
+        
+        Runs on the caller's event loop; call install_uvloop() before
+        starting that loop to serve webhooks on uvloop.
+        """
         import uvicorn
         
         config = uvicorn.Config(
@@ -304,21 +319,20 @@ class A2AWebhookHandler:
         Returns:
             True if webhook was sent successfully
         """
-        import httpx
-        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    target_url,
-                    json=notification_data,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                
-                logger.debug(f"Webhook sent successfully to {target_url}")
-                return True
-                
+            # Reuse the pooled client so each webhook skips the handshake
+            client = await get_http_client()
+            response = await client.post(
+                target_url,
+                content=orjson.dumps(notification_data),
+                headers={"Content-Type": "application/json"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            
+            logger.debug(f"Webhook sent successfully to {target_url}")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to send webhook to {target_url}: {e}")
             return False
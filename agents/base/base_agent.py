@@ -6,13 +6,33 @@ Provides common functionality and interface definitions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, Dict, Any, Mapping, Optional, List, Tuple
+from datetime import datetime
+import time
 import uuid
 from a2a_protocol.message_schema import TaskStatus, TaskParameters, AnalysisResult
 from utils.logger import A2ALogger
 
 
+@dataclass(slots=True)
+class TaskRecord:
+    """Bookkeeping for a single agent task; timestamps are time.time_ns() ints"""
+    task_id: str
+    task_type: str
+    parameters: Dict[str, Any]
+    status: TaskStatus
+    created_at_ns: int
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
+    last_updated_ns: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all A2A agents
@@ -21,6 +41,10 @@ class BaseAgent(ABC):
     task tracking, and A2A protocol compliance.
     """
     
+    # Upper bound on retained task history entries; oldest are evicted first
+    TASK_HISTORY_LIMIT = 10_000
+    TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+    
     def __init__(self, agent_id: str, agent_type: str, name: str):
         """
         Initialize base agent
@@ -35,13 +59,24 @@ class BaseAgent(ABC):
         self.name = name
         self.logger = A2ALogger(agent_id, agent_type)
         self.status = "initialized"
-        self.active_tasks: Dict[str, Dict[str, Any]] = {}
-        self.task_history: List[Dict[str, Any]] = []
-        self.created_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
+        self.active_tasks: Dict[str, TaskRecord] = {}
+        # History entries alias the live task records, so status updates show up in both
+        self.task_history: Deque[TaskRecord] = deque(maxlen=self.TASK_HISTORY_LIMIT)
+        # (completed_at_ns, task_id) in completion order, consumed by cleanup_old_tasks
+        self._completed_tasks: Deque[Tuple[int, str]] = deque()
+        # Timestamps are kept as time.time_ns() ints and formatted on output
+        self.created_at_ns = time.time_ns()
+        self.last_activity_ns = self.created_at_ns
         
         self.logger.info(f"Initialized {agent_type} agent: {name}")
     
+    @staticmethod
+    def _iso(ns: Optional[int]) -> Optional[str]:
+        """Format a time.time_ns() reading as a UTC ISO timestamp"""
+        if ns is None:
+            return None
+        return datetime.utcfromtimestamp(ns / 1e9).isoformat()
+    
     @abstractmethod
     async def start(self) -> bool:
         """
@@ -76,37 +111,34 @@ class BaseAgent(ABC):
             "status": self.status,
             "active_tasks": len(self.active_tasks),
             "total_tasks": len(self.task_history),
-            "created_at": self.created_at.isoformat(),
-            "last_activity": self.last_activity.isoformat()
+            "created_at": self._iso(self.created_at_ns),
+            "last_activity": self._iso(self.last_activity_ns)
         }
     
-    def create_task(self, task_type: str, parameters: Dict[str, Any]) -> str:
+    def create_task(self, task_type: str, parameters: Dict[str, Any], task_id: Optional[str] = None) -> str:
         """
         Create a new task
         
         Args:
             task_type: Type of task
             parameters: Task parameters
+            task_id: Optional identifier to track the task under, e.g. a request ID
             
         Returns:
             Task ID
         """
-        task_id = str(uuid.uuid4())
+        task_id = task_id or str(uuid.uuid4())
         
-        task_info = {
-            "task_id": task_id,
-            "task_type": task_type,
-            "parameters": parameters,
-            "status": TaskStatus.PENDING,
-            "created_at": datetime.utcnow(),
-            "started_at": None,
-            "completed_at": None,
-            "result": None,
-            "error": None
-        }
+        task_info = TaskRecord(
+            task_id=task_id,
+            task_type=task_type,
+            parameters=parameters,
+            status=TaskStatus.PENDING,
+            created_at_ns=time.time_ns()
+        )
         
         self.active_tasks[task_id] = task_info
-        self.task_history.append(task_info.copy())
+        self.task_history.append(task_info)
         
         self.logger.log_task_start(task_id, task_type)
         return task_id
@@ -126,28 +158,32 @@ class BaseAgent(ABC):
             return
         
         task_info = self.active_tasks[task_id]
-        task_info["status"] = status
-        task_info["last_updated"] = datetime.utcnow()
+        was_terminal = task_info.status in self.TERMINAL_STATUSES
+        now_ns = time.time_ns()
+        task_info.status = status
+        task_info.last_updated_ns = now_ns
         
         if status == TaskStatus.RUNNING:
-            task_info["started_at"] = datetime.utcnow()
-        elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-            task_info["completed_at"] = datetime.utcnow()
+            task_info.started_at_ns = now_ns
+        elif status in self.TERMINAL_STATUSES:
+            task_info.completed_at_ns = now_ns
+            if not was_terminal:
+                self._completed_tasks.append((now_ns, task_id))
             
             # Move to history if completed
             if status == TaskStatus.COMPLETED:
-                task_info["result"] = result
+                task_info.result = result
                 self.logger.log_task_complete(task_id, 0.0)  # Duration would be calculated
             else:
-                task_info["error"] = error
+                task_info.error = error
                 self.logger.log_task_error(task_id, error or "Unknown error")
             
             # Keep in active tasks for a while, then move to history
             # In a real implementation, you might want to implement cleanup logic
         
-        self.last_activity = datetime.utcnow()
+        self.last_activity_ns = now_ns
     
-    def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+    def get_task_status(self, task_id: str) -> Optional[TaskRecord]:
         """
         Get task status
         
@@ -159,11 +195,11 @@ class BaseAgent(ABC):
         """
         return self.active_tasks.get(task_id)
     
-    def get_active_tasks(self) -> Dict[str, Dict[str, Any]]:
-        """Get all active tasks"""
-        return self.active_tasks.copy()
+    def get_active_tasks(self) -> Mapping[str, TaskRecord]:
+        """Get a read-only live view of all active tasks"""
+        return MappingProxyType(self.active_tasks)
     
-    def get_task_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_task_history(self, limit: Optional[int] = None) -> List[TaskRecord]:
         """
         Get task history
         
@@ -171,11 +207,12 @@ class BaseAgent(ABC):
             limit: Optional limit on number of tasks to return
             
         Returns:
-            List of historical tasks
+            List of historical tasks, oldest first
         """
-        history = self.task_history.copy()
-        if limit:
-            history = history[-limit:]
+        if not limit:
+            return list(self.task_history)
+        history = list(islice(reversed(self.task_history), limit))
+        history.reverse()
         return history
     
     def cancel_task(self, task_id: str) -> bool:
@@ -192,7 +229,7 @@ class BaseAgent(ABC):
             return False
         
         task_info = self.active_tasks[task_id]
-        if task_info["status"] in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+        if task_info.status in self.TERMINAL_STATUSES:
             return False
         
         self.update_task_status(task_id, TaskStatus.CANCELLED, error="Cancelled by user")
@@ -206,19 +243,18 @@ class BaseAgent(ABC):
         Args:
             max_age_hours: Maximum age of tasks to keep in active list
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        
-        tasks_to_remove = []
-        for task_id, task_info in self.active_tasks.items():
-            if (task_info["status"] in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED] and
-                task_info.get("completed_at") and task_info["completed_at"] < cutoff_time):
-                tasks_to_remove.append(task_id)
+        cutoff_ns = time.time_ns() - max_age_hours * 3_600_000_000_000
         
-        for task_id in tasks_to_remove:
-            del self.active_tasks[task_id]
+        # Completion order is chronological, so stop at the first recent entry
+        completed = self._completed_tasks
+        removed = 0
+        while completed and completed[0][0] < cutoff_ns:
+            _, task_id = completed.popleft()
+            if self.active_tasks.pop(task_id, None) is not None:
+                removed += 1
         
-        if tasks_to_remove:
-            self.logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
+        if removed:
+            self.logger.info(f"Cleaned up {removed} old tasks")
     
     def validate_task_parameters(self, parameters: Dict[str, Any]) -> bool:
         """
@@ -288,7 +324,7 @@ class BaseAgent(ABC):
         """
         old_status = self.status
         self.status = status
-        self.last_activity = datetime.utcnow()
+        self.last_activity_ns = time.time_ns()
         
         self.logger.info(f"Agent status changed from {old_status} to {status}")
     
@@ -312,7 +348,7 @@ class BaseAgent(ABC):
         return {
             "status": "healthy" if self.status == "active" else "unhealthy",
             "agent_id": self.agent_id,
-            "uptime": (datetime.utcnow() - self.created_at).total_seconds(),
+            "uptime": (time.time_ns() - self.created_at_ns) / 1e9,
             "active_tasks": len(self.active_tasks),
-            "last_activity": self.last_activity.isoformat()
+            "last_activity": self._iso(self.last_activity_ns)
         }
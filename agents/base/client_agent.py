@@ -5,16 +5,29 @@ This module defines the base class for client agents (like the coordinator)
 that send tasks to remote agents via the A2A protocol.
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Any, Iterable, Optional, List, Set, Tuple
+import time
 import asyncio
 from .base_agent import BaseAgent
 from a2a_protocol.protocol_handler import A2AProtocolHandler
-from a2a_protocol.message_schema import TaskResponse, AnalysisResult, TaskStatus
+from a2a_protocol.message_schema import AgentInfo, TaskResponse, AnalysisResult, TaskStatus
 from registry.agent_registry import AgentRegistry
 from utils.logger import A2ALogger
 
 
+@dataclass(slots=True)
+class PendingResponse:
+    """A task sent to a remote agent whose result has not been collected"""
+    target_agent_id: str
+    target_endpoint: str
+    task_type: str
+    sent_at: float  # time.monotonic()
+    # Resolved with the TaskResponse once the remote agent has answered
+    future: asyncio.Future
+
+
 class ClientAgent(BaseAgent):
     """
     Base class for client agents that communicate with remote agents
@@ -23,12 +36,22 @@ class ClientAgent(BaseAgent):
     managing responses, and aggregating results.
     """
     
+    # Slack on top of response_timeout before a multi-agent dispatch gives up
+    DISPATCH_TIMEOUT_BUFFER = 5.0
+    # Seconds a capability lookup result is reused
+    AGENT_CACHE_TTL = 60.0
+    # Weight of the newest sample in each agent's round-trip average
+    LATENCY_EWMA_ALPHA = 0.2
+    # Collected results kept for repeat lookups; oldest are evicted first
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(
         self, 
         agent_id: str, 
         name: str,
         registry: Optional[AgentRegistry] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        trusted_peers: bool = False
     ):
         """
         Initialize client agent
@@ -38,16 +61,36 @@ class ClientAgent(BaseAgent):
             name: Human-readable agent name
             registry: Agent registry for discovery
             timeout: Request timeout in seconds
+            trusted_peers: Skip response validation; only for registries
+                whose agents all run our own RemoteAgent handler
         """
         super().__init__(agent_id, "client", name)
         self.registry = registry
-        self.protocol_handler = A2AProtocolHandler(agent_id, timeout)
+        # Requests, status queries and cancellations all share the
+        # pooled HTTP client
+        self.protocol_handler = A2AProtocolHandler(agent_id, timeout, trusted_peers=trusted_peers)
         self.logger = A2ALogger(agent_id, "client")
         
         # Task management
-        self.pending_responses: Dict[str, Dict[str, Any]] = {}
+        self.pending_responses: Dict[str, PendingResponse] = {}
         self.response_timeout = timeout
         
+        # Parsed results of collected tasks, in collection order, so later
+        # lookups skip re-validation once the pending entry is gone
+        self._results: Dict[str, AnalysisResult] = {}
+        
+        # Registry lookups keyed by (kind, *sorted capabilities):
+        # (cached_at, registry revision, value)
+        self._agent_cache: Dict[Tuple[str, ...], Tuple[float, int, Any]] = {}
+        
+        # Per-agent load for least-loaded dispatch: uncollected tasks and
+        # an exponentially weighted average of request round trips
+        self._inflight: Counter = Counter()
+        self._latency: Dict[str, float] = {}
+        
+        # Fan-out sends and outstanding requests, cancelled together on stop()
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        
         self.logger.info(f"Initialized client agent: {name}")
     
     async def start(self) -> bool:
@@ -87,11 +130,16 @@ class ClientAgent(BaseAgent):
             if self.registry:
                 self.registry.stop_health_monitoring()
             
-            # Cancel all pending tasks
-            for task_id in list(self.pending_responses.keys()):
-                await self.cancel_remote_task(task_id)
+            # Cancel all pending tasks, so remote agents stop working on them
+            await self.cancel_remote_tasks(list(self.pending_responses))
             
-            # Close protocol handler
+            # Abort sends and requests that are still in flight
+            for send in list(self._dispatch_tasks):
+                send.cancel()
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+            
+            # Close protocol handler; the shared HTTP client is closed
+            # once at process shutdown, as other agents may still use it
             await self.protocol_handler.close()
             
             self.update_status("stopped")
@@ -128,38 +176,118 @@ class ClientAgent(BaseAgent):
             if not agent_info:
                 raise Exception(f"Agent {target_agent_id} not found in registry")
             
+        except Exception as e:
+            self.logger.log_dispatch(None, target_agent_id, False, error=str(e))
+            raise
+        
+        return await self._send_task_with_info(agent_info, task_params, task_type)
+    
+    async def _send_task_with_info(
+        self, 
+        agent_info: AgentInfo, 
+        task_params: Dict[str, Any],
+        task_type: str
+    ) -> str:
+        """
+        Send task to a remote agent already looked up in the registry
+        
+        Returns once the request is under way; the RPC runs in the
+        background and resolves the pending response's future, so
+        callers can collect results in completion order.
+        
+        Args:
+            agent_info: Target agent information
+            task_params: Task parameters
+            task_type: Type of task
+            
+        Returns:
+            Task ID for tracking
+        """
+        target_agent_id = agent_info.agent_id
+        task_id = None
+        
+        try:
             # Create local task
             task_id = self.create_task(task_type, task_params)
             
-            # Send task to remote agent
-            self.logger.log_protocol_message("task_request", target_agent_id, "outgoing")
-            
-            response = await self.protocol_handler.send_task_request(
-                agent_info.endpoint,
-                task_params,
-                task_id
+            # Track pending response, resolved when the RPC reply arrives
+            future = asyncio.get_running_loop().create_future()
+            self.pending_responses[task_id] = PendingResponse(
+                target_agent_id=target_agent_id,
+                target_endpoint=agent_info.endpoint,
+                task_type=task_type,
+                sent_at=time.monotonic(),
+                future=future
             )
+            self._inflight[target_agent_id] += 1
             
-            # Track pending response
-            self.pending_responses[task_id] = {
-                "target_agent_id": target_agent_id,
-                "target_endpoint": agent_info.endpoint,
-                "task_type": task_type,
-                "sent_at": datetime.utcnow(),
-                "response": response
-            }
+            # Send task to remote agent; cancelling the pending response
+            # also aborts the request
+            request = asyncio.create_task(
+                self._request_task(task_id, agent_info, task_params, future)
+            )
+            self._dispatch_tasks.add(request)
+            request.add_done_callback(self._dispatch_tasks.discard)
+            future.add_done_callback(lambda f: request.cancel() if f.cancelled() else None)
             
             # Update task status
             self.update_task_status(task_id, TaskStatus.RUNNING)
             
-            self.logger.log_agent_communication(target_agent_id, "send_task", True)
+            self.logger.log_dispatch(task_id, target_agent_id, True)
             return task_id
             
-        except Exception as e:
-            self.logger.error(f"Failed to send task to agent {target_agent_id}: {e}")
-            self.logger.log_agent_communication(target_agent_id, "send_task", False)
+        except BaseException as e:
+            # Cancellation (including a dispatch timeout) raises no message
+            error = str(e) or "dispatch timed out or was cancelled"
+            self.logger.log_dispatch(task_id, target_agent_id, False, error=error)
+            
+            # Fail the local task so it does not linger as pending
+            if task_id is not None:
+                self.update_task_status(task_id, TaskStatus.FAILED, error=error)
             raise
     
+    async def _request_task(
+        self, 
+        task_id: str, 
+        agent_info: AgentInfo, 
+        task_params: Dict[str, Any],
+        future: asyncio.Future
+    ):
+        """
+        Run a task's RPC and resolve its pending response with the reply
+        
+        Args:
+            task_id: Task identifier
+            agent_info: Target agent information
+            task_params: Task parameters
+            future: Future of the task's pending response
+        """
+        target_agent_id = agent_info.agent_id
+        sent_at = time.monotonic()
+        
+        try:
+            response = await self.protocol_handler.send_task_request(
+                agent_info.endpoint,
+                task_params,
+                task_id,
+                serialization=agent_info.serialization
+            )
+        except BaseException as e:
+            # A task already cancelled through cancel_remote_task(s) is
+            # no longer pending and keeps its CANCELLED status
+            error = str(e) or "request timed out or was cancelled"
+            if self._pop_pending(task_id) is not None:
+                self.logger.log_dispatch(task_id, target_agent_id, False, error=error)
+                self.update_task_status(task_id, TaskStatus.FAILED, error=error)
+            future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+        
+        self._record_latency(target_agent_id, time.monotonic() - sent_at)
+        if not future.done():
+            future.set_result(response)
+    
     async def send_task_by_capability(
         self, 
         required_capabilities: List[str], 
@@ -181,15 +309,15 @@ class ClientAgent(BaseAgent):
             if not self.registry:
                 raise Exception("No registry available for agent discovery")
             
-            # Find best agent for capabilities
-            best_agent = self.registry.find_best_agent(required_capabilities)
+            # Find best agent for capabilities, preferring the least loaded
+            best_agent = self._select_agent(required_capabilities)
             if not best_agent:
                 self.logger.warning(f"No agent found with capabilities: {required_capabilities}")
                 return None
             
             # Send task to best agent
-            task_id = await self.send_task_to_agent(
-                best_agent.agent_id,
+            task_id = await self._send_task_with_info(
+                best_agent,
                 task_params,
                 task_type
             )
@@ -201,6 +329,111 @@ class ClientAgent(BaseAgent):
             self.logger.error(f"Failed to send task by capability: {e}")
             return None
     
+    def _select_agent(self, required_capabilities: List[str]) -> Optional[AgentInfo]:
+        """
+        Pick an agent for capabilities, preferring the least loaded
+        
+        Among matching agents, the one with the fewest uncollected tasks
+        wins, with ties broken by average round trip. Until any
+        candidate has been measured, the registry's best agent is used.
+        
+        Args:
+            required_capabilities: List of required capabilities
+            
+        Returns:
+            Selected agent or None
+        """
+        candidates = self._cached_registry_lookup(
+            "candidates", required_capabilities, self.registry.find_candidates
+        )
+        if not candidates:
+            return None
+        
+        if not any(agent.agent_id in self._latency for agent in candidates):
+            return self._cached_registry_lookup(
+                "best", required_capabilities, self.registry.find_best_agent
+            )
+        
+        return min(
+            candidates,
+            key=lambda agent: (self._inflight[agent.agent_id], self._latency.get(agent.agent_id, 0.0))
+        )
+    
+    def _cached_registry_lookup(
+        self, 
+        kind: str, 
+        required_capabilities: List[str], 
+        lookup: Callable[[List[str]], Any]
+    ) -> Any:
+        """
+        Run a capability lookup against the registry, reusing recent results
+        
+        Cached entries expire after AGENT_CACHE_TTL or as soon as the
+        registry reports a membership, status or health change.
+        
+        Args:
+            kind: Lookup name, used to keep different lookups apart
+            required_capabilities: List of required capabilities
+            lookup: Registry method to call on a cache miss
+            
+        Returns:
+            Lookup result
+        """
+        key = (kind, *sorted(required_capabilities))
+        revision = self.registry.revision
+        cached = self._agent_cache.get(key)
+        if cached and cached[1] == revision and time.monotonic() - cached[0] < self.AGENT_CACHE_TTL:
+            return cached[2]
+        
+        value = lookup(required_capabilities)
+        self._agent_cache[key] = (time.monotonic(), revision, value)
+        return value
+    
+    def _record_latency(self, agent_id: str, seconds: float):
+        """
+        Fold a request round trip into an agent's moving average
+        
+        Args:
+            agent_id: Agent identifier
+            seconds: Observed round trip in seconds
+        """
+        previous = self._latency.get(agent_id)
+        if previous is None:
+            self._latency[agent_id] = seconds
+        else:
+            self._latency[agent_id] = previous + self.LATENCY_EWMA_ALPHA * (seconds - previous)
+    
+    def _pop_pending(self, task_id: str) -> Optional[PendingResponse]:
+        """
+        Stop tracking a pending response and release its agent's load slot
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            The removed pending response, or None if it was already removed
+        """
+        pending = self.pending_responses.pop(task_id, None)
+        if pending is None:
+            return None
+        
+        self._inflight[pending.target_agent_id] -= 1
+        if self._inflight[pending.target_agent_id] <= 0:
+            del self._inflight[pending.target_agent_id]
+        return pending
+    
+    def _remember_result(self, task_id: str, result: AnalysisResult):
+        """
+        Keep a collected result for repeat lookups
+        
+        Args:
+            task_id: Task identifier
+            result: Parsed analysis result
+        """
+        self._results[task_id] = result
+        if len(self._results) > self.RESULT_CACHE_SIZE:
+            del self._results[next(iter(self._results))]
+    
     async def send_tasks_to_multiple_agents(
         self, 
         agent_capability_map: Dict[str, List[str]], 
@@ -221,23 +454,35 @@ class ClientAgent(BaseAgent):
         task_ids = {}
         
         try:
-            # Create tasks for each agent
-            tasks = []
-            for agent_id, capabilities in agent_capability_map.items():
-                if self.registry and self.registry.get_agent(agent_id):
-                    task = self.send_task_to_agent(agent_id, task_params, task_type)
-                    tasks.append((agent_id, task))
-            
-            # Execute all tasks concurrently
-            if tasks:
-                results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+            # Look all targets up in one pass, then dispatch with the
+            # resolved info so each send skips its own registry lookup
+            agents = self.registry.get_many(list(agent_capability_map)) if self.registry else {}
+            sends = {
+                asyncio.create_task(self._send_task_with_info(agent_info, task_params, task_type)): agent_id
+                for agent_id, agent_info in agents.items()
+            }
+            for send in sends:
+                self._dispatch_tasks.add(send)
+                send.add_done_callback(self._dispatch_tasks.discard)
+            
+            # Execute all tasks concurrently, bounded so one hung agent
+            # cannot stall the whole dispatch
+            if sends:
+                done, pending = await asyncio.wait(
+                    sends,
+                    timeout=self.response_timeout + self.DISPATCH_TIMEOUT_BUFFER
+                )
                 
-                for i, (agent_id, _) in enumerate(tasks):
-                    result = results[i]
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Failed to send task to {agent_id}: {result}")
+                for send in pending:
+                    send.cancel()
+                    self.logger.error(f"Timed out sending task to {sends[send]}")
+                
+                for send in done:
+                    agent_id = sends[send]
+                    if send.exception():
+                        self.logger.error(f"Failed to send task to {agent_id}: {send.exception()}")
                     else:
-                        task_ids[agent_id] = result
+                        task_ids[agent_id] = send.result()
             
             self.logger.info(f"Sent tasks to {len(task_ids)} agents")
             return task_ids
@@ -258,27 +503,55 @@ class ClientAgent(BaseAgent):
             Analysis result or None if not available
         """
         try:
+            # Collected already, by an earlier call
+            result = self._results.get(task_id)
+            if result is not None:
+                return result
+            
             # Check if we have the response
             if task_id not in self.pending_responses:
                 self.logger.warning(f"No pending response for task {task_id}")
                 return None
             
-            response_info = self.pending_responses[task_id]
-            response = response_info["response"]
+            pending = self.pending_responses[task_id]
+            
+            # Wait for the response without cancelling it on timeout, so a
+            # later call can still collect it
+            future = pending.future
+            try:
+                response = await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout or self.response_timeout
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Timed out waiting for result of task {task_id}")
+                return None
+            except asyncio.CancelledError:
+                # The task was cancelled remotely while we waited
+                if future.cancelled():
+                    return None
+                raise
+            
+            # A concurrent call may have collected the same response
+            result = self._results.get(task_id)
+            if result is not None:
+                return result
             
             # Check for errors in response
             if response.error:
-                self.logger.error(f"Task {task_id} failed: {response.error}")
-                self.update_task_status(task_id, TaskStatus.FAILED, error=str(response.error))
+                if self._pop_pending(task_id) is not None:
+                    self.logger.error(f"Task {task_id} failed: {response.error}")
+                    self.update_task_status(task_id, TaskStatus.FAILED, error=str(response.error))
                 return None
             
             # Extract result
             if response.result:
-                result = AnalysisResult(**response.result)
+                result = AnalysisResult.model_validate(response.result)
+                self._remember_result(task_id, result)
                 self.update_task_status(task_id, TaskStatus.COMPLETED, result=response.result)
                 
                 # Clean up pending response
-                del self.pending_responses[task_id]
+                self._pop_pending(task_id)
                 
                 return result
             
@@ -288,6 +561,24 @@ class ClientAgent(BaseAgent):
             self.logger.error(f"Error getting task result for {task_id}: {e}")
             return None
     
+    def complete_remote_task(self, task_id: str, response: TaskResponse) -> bool:
+        """
+        Deliver a response that arrived outside the original request
+        
+        Args:
+            task_id: Task identifier
+            response: Response from the remote agent
+            
+        Returns:
+            True if a waiting task was completed
+        """
+        pending = self.pending_responses.get(task_id)
+        if pending is None or pending.future.done():
+            return False
+        
+        pending.future.set_result(response)
+        return True
+    
     async def cancel_remote_task(self, task_id: str) -> bool:
         """
         Cancel a task on the remote agent
@@ -302,15 +593,15 @@ class ClientAgent(BaseAgent):
             if task_id not in self.pending_responses:
                 return False
             
-            response_info = self.pending_responses[task_id]
-            target_endpoint = response_info["target_endpoint"]
+            target_endpoint = self.pending_responses[task_id].target_endpoint
             
             # Cancel task on remote agent
             success = await self.protocol_handler.cancel_task(target_endpoint, task_id)
             
-            if success:
+            pending = self._pop_pending(task_id) if success else None
+            if pending is not None:
                 self.update_task_status(task_id, TaskStatus.CANCELLED)
-                del self.pending_responses[task_id]
+                pending.future.cancel()
                 self.logger.info(f"Cancelled remote task {task_id}")
             
             return success
@@ -319,6 +610,45 @@ class ClientAgent(BaseAgent):
             self.logger.error(f"Failed to cancel remote task {task_id}: {e}")
             return False
     
+    async def cancel_remote_tasks(self, task_ids: Iterable[str]):
+        """
+        Cancel several remote tasks, one batch per agent endpoint
+        
+        Args:
+            task_ids: Task identifiers; ones without a pending response are skipped
+        """
+        by_endpoint: Dict[str, List[str]] = defaultdict(list)
+        for task_id in task_ids:
+            pending = self.pending_responses.get(task_id)
+            if pending:
+                by_endpoint[pending.target_endpoint].append(task_id)
+        await asyncio.gather(*[
+            self._cancel_remote_batch(endpoint, endpoint_task_ids)
+            for endpoint, endpoint_task_ids in by_endpoint.items()
+        ])
+    
+    async def _cancel_remote_batch(self, endpoint: str, task_ids: List[str]):
+        """
+        Cancel several tasks on one remote agent
+        
+        Falls back to one request per task if the agent rejects the batch.
+        
+        Args:
+            endpoint: Agent endpoint URL
+            task_ids: Task identifiers sent to that agent
+        """
+        if not await self.protocol_handler.cancel_tasks(endpoint, task_ids):
+            for task_id in task_ids:
+                await self.cancel_remote_task(task_id)
+            return
+        
+        for task_id in task_ids:
+            pending = self._pop_pending(task_id)
+            if pending is not None:
+                self.update_task_status(task_id, TaskStatus.CANCELLED)
+                pending.future.cancel()
+        self.logger.info(f"Cancelled {len(task_ids)} remote tasks at {endpoint}")
+    
     async def query_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Query task status from remote agent
@@ -333,8 +663,7 @@ class ClientAgent(BaseAgent):
             if task_id not in self.pending_responses:
                 return None
             
-            response_info = self.pending_responses[task_id]
-            target_endpoint = response_info["target_endpoint"]
+            target_endpoint = self.pending_responses[task_id].target_endpoint
             
             status = await self.protocol_handler.query_task_status(target_endpoint, task_id)
             return status
@@ -343,7 +672,7 @@ class ClientAgent(BaseAgent):
             self.logger.error(f"Failed to query task status for {task_id}: {e}")
             return None
     
-    def get_pending_tasks(self) -> Dict[str, Dict[str, Any]]:
+    def get_pending_tasks(self) -> Dict[str, PendingResponse]:
         """Get all pending task responses"""
         return self.pending_responses.copy()
     
@@ -365,14 +694,66 @@ class ClientAgent(BaseAgent):
         results = {}
         
         try:
-            # Wait for all tasks to complete
-            for task_id in task_ids:
-                result = await self.get_task_result(task_id, timeout)
-                if result:
-                    results[task_id] = result
+            async for task_id, result in self.iter_task_results(task_ids, timeout):
+                results[task_id] = result
             
             return results
             
         except Exception as e:
             self.logger.error(f"Error waiting for task completion: {e}")
             return results
+    
+    async def iter_task_results(
+        self, 
+        task_ids: List[str], 
+        timeout: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, AnalysisResult]]:
+        """
+        Yield task results in the order they complete
+        
+        Fetches that are still running when the timeout expires, or when
+        the caller stops iterating, are cancelled.
+        
+        Args:
+            task_ids: List of task IDs to wait for
+            timeout: Optional overall timeout in seconds
+            
+        Yields:
+            (task_id, result) pairs for tasks that produced a result
+        """
+        if not task_ids:
+            return
+        
+        # Fetch all results concurrently
+        fetches = {
+            asyncio.create_task(self.get_task_result(task_id, timeout)): task_id
+            for task_id in task_ids
+        }
+        pending = set(fetches)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        
+        try:
+            while pending:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for fetch in done:
+                    task_id = fetches[fetch]
+                    if fetch.exception():
+                        self.logger.error(f"Error getting result for task {task_id}: {fetch.exception()}")
+                    elif fetch.result():
+                        yield task_id, fetch.result()
+            
+            for fetch in pending:
+                self.logger.warning(f"Timed out waiting for task {fetches[fetch]}")
+                
+        finally:
+            # Stragglers past the timeout, or left behind by an early exit
+            for fetch in pending:
+                fetch.cancel()
@@ -5,28 +5,46 @@ This module defines the base class for remote agents that receive
 and process tasks via the A2A protocol.
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import deque
+from itertools import count
+from typing import Deque, Dict, Any, Optional, List
 import asyncio
 from abc import abstractmethod
+import orjson
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from .base_agent import BaseAgent
 from a2a_protocol.message_schema import (
-    TaskRequest, TaskResponse, TaskStatus, AnalysisResult, 
+    TaskRequest, TaskStatus, AnalysisResult, 
     AgentInfo, AgentCapability
 )
+from a2a_protocol.serialization import (
+    JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, decode_body, encode_body, is_msgpack
+)
+from a2a_protocol.orjson_response import ORJSONResponse
 from utils.logger import A2ALogger
 
+# JSON-RPC methods answered by cancelling tasks instead of analysing
+CANCEL_METHODS = frozenset({"cancel_task", "cancel_tasks"})
+
 
 class RemoteAgent(BaseAgent):
     """
     Base class for remote agents that process tasks from client agents
     
     Provides HTTP endpoints for receiving A2A protocol messages,
-    task processing, and response handling.
+    task processing, and response handling. Incoming tasks wait in a
+    priority queue (lower "priority" parameter runs first) and are run
+    by a fixed pool of workers, started with the agent or by the first
+    queued task when the app is served some other way.
     """
     
+    TASK_QUEUE_MAXSIZE = 1000
+    TASK_WORKERS = 4
+    DEFAULT_TASK_PRIORITY = 5
+    # Seconds an /analyze request waits for its queued task to finish
+    TASK_TIMEOUT = 300.0
+    
     def __init__(
         self, 
         agent_id: str, 
@@ -47,12 +65,26 @@ class RemoteAgent(BaseAgent):
         self.port = port
         self.capabilities = capabilities
         self.logger = A2ALogger(agent_id, "remote")
+        # Encoded /capabilities body; capabilities are fixed once the agent is built
+        self._capabilities_payload: Optional[bytes] = None
+        
+        # (priority, sequence, future, request); the sequence keeps equal
+        # priorities FIFO and stops comparisons reaching the request
+        self._task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=self.TASK_QUEUE_MAXSIZE)
+        self._task_sequence = count()
+        self._workers: List[asyncio.Task] = []
+        # Futures of queued or running requests by request ID; cancelling
+        # one drops the task from the queue or stops its analysis
+        self._task_futures: Dict[Any, asyncio.Future] = {}
+        # IDs of tasks that failed or timed out, most recent last
+        self.dead_letters: Deque[str] = deque(maxlen=1000)
         
         # Create FastAPI app
         self.app = FastAPI(
             title=f"A2A {name}",
             description=f"Remote agent for {name}",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         # Register endpoints
@@ -66,36 +98,48 @@ class RemoteAgent(BaseAgent):
         @self.app.post("/analyze")
         async def analyze_code(request: Request):
             """Main analysis endpoint"""
+            content_type = request.headers.get("content-type")
+            task_id = None
             try:
-                data = await request.json()
-                task_request = TaskRequest(**data)
+                data = decode_body(await request.body(), content_type)
+                task_id = data.get("id")
                 
-                self.logger.log_protocol_message("task_request", "client", "incoming")
+                if data.get("method") in CANCEL_METHODS:
+                    params = data.get("params") or {}
+                    task_ids = params.get("task_ids") or [params.get("task_id")]
+                    return self._rpc_response({
+                        "jsonrpc": "2.0",
+                        "id": task_id,
+                        "result": {"cancelled": self._cancel_tasks(task_ids)},
+                        "error": None
+                    }, content_type)
                 
-                # Process the task
-                result = await self.process_task(task_request)
+                task_request = TaskRequest.model_validate(data)
+                task_id = task_request.id
+                
+                self.logger.log_protocol_message("task_request", "client", "incoming")
                 
-                # Create response
-                response = TaskResponse(
-                    id=task_request.id,
-                    result=result.dict() if result else None
-                )
+                # Queue the task and wait for a worker to process it
+                result = await self._run_queued(task_request)
                 
-                return response.dict()
+                return self._rpc_response({
+                    "jsonrpc": "2.0",
+                    "id": task_id,
+                    "result": result.model_dump() if result else None,
+                    "error": None
+                }, content_type)
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 self.logger.error(f"Error processing analysis request: {e}")
                 
-                # Create error response
-                error_response = TaskResponse(
-                    id=getattr(task_request, 'id', None) if 'task_request' in locals() else None,
-                    error={
-                        "code": -1,
-                        "message": str(e)
-                    }
-                )
-                
-                return error_response.dict()
+                return self._rpc_response({
+                    "jsonrpc": "2.0",
+                    "id": task_id,
+                    "result": None,
+                    "error": {"code": -1, "message": str(e)}
+                }, content_type)
         
         @self.app.get("/task_status/{task_id}")
         async def get_task_status(task_id: str):
@@ -108,10 +152,10 @@ class RemoteAgent(BaseAgent):
                 
                 return {
                     "task_id": task_id,
-                    "status": task_info["status"].value,
-                    "created_at": task_info["created_at"].isoformat(),
-                    "started_at": task_info["started_at"].isoformat() if task_info["started_at"] else None,
-                    "completed_at": task_info["completed_at"].isoformat() if task_info["completed_at"] else None
+                    "status": task_info.status.value,
+                    "created_at": self._iso(task_info.created_at_ns),
+                    "started_at": self._iso(task_info.started_at_ns),
+                    "completed_at": self._iso(task_info.completed_at_ns)
                 }
                 
             except HTTPException:
@@ -124,7 +168,7 @@ class RemoteAgent(BaseAgent):
         async def cancel_task(task_id: str):
             """Cancel task endpoint"""
             try:
-                success = self.cancel_task(task_id)
+                success = self._cancel_tasks([task_id])
                 
                 if not success:
                     raise HTTPException(status_code=404, detail="Task not found or cannot be cancelled")
@@ -137,6 +181,17 @@ class RemoteAgent(BaseAgent):
                 self.logger.error(f"Error cancelling task {task_id}: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
         
+        @self.app.post("/cancel_batch")
+        async def cancel_batch(request: Request):
+            """Cancel several tasks in one request"""
+            try:
+                data = orjson.loads(await request.body())
+                return {"cancelled": self._cancel_tasks(data.get("task_ids", []))}
+                
+            except Exception as e:
+                self.logger.error(f"Error cancelling task batch: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+        
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint"""
@@ -152,8 +207,9 @@ class RemoteAgent(BaseAgent):
         async def get_capabilities():
             """Get agent capabilities"""
             try:
-                capabilities = self.get_capabilities()
-                return {"capabilities": capabilities}
+                if self._capabilities_payload is None:
+                    self._capabilities_payload = orjson.dumps({"capabilities": self.get_capabilities()})
+                return Response(content=self._capabilities_payload, media_type=JSON_CONTENT_TYPE)
                 
             except Exception as e:
                 self.logger.error(f"Error getting capabilities: {e}")
@@ -170,6 +226,127 @@ class RemoteAgent(BaseAgent):
                 self.logger.error(f"Error getting agent status: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
     
+    async def _run_queued(self, task_request: TaskRequest) -> Optional[AnalysisResult]:
+        """
+        Queue a task by priority and wait for its result
+        
+        Args:
+            task_request: Task request from client
+            
+        Returns:
+            Analysis result or None if processing failed
+        """
+        try:
+            priority = int(task_request.params.get("priority", self.DEFAULT_TASK_PRIORITY))
+        except (TypeError, ValueError):
+            priority = self.DEFAULT_TASK_PRIORITY
+        
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._task_queue.put_nowait((priority, next(self._task_sequence), future, task_request))
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=429, detail="Task queue is full")
+        self._start_workers()
+        
+        if task_request.id is not None:
+            self._task_futures[task_request.id] = future
+        try:
+            # Shielded so a cancel request can be told apart from this
+            # request itself being cancelled
+            result = await asyncio.wait_for(asyncio.shield(future), self.TASK_TIMEOUT)
+        except asyncio.TimeoutError:
+            future.cancel()
+            self.dead_letters.append(task_request.id)
+            raise asyncio.TimeoutError(
+                f"Task {task_request.id} timed out after {self.TASK_TIMEOUT:g}s"
+            ) from None
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                future.cancel()
+                raise
+            raise Exception(f"Task {task_request.id} was cancelled")
+        finally:
+            if self._task_futures.get(task_request.id) is future:
+                del self._task_futures[task_request.id]
+        
+        if result is None:
+            self.dead_letters.append(task_request.id)
+        return result
+    
+    def _start_workers(self):
+        """Start the task workers unless they are already running"""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker_loop())
+            for _ in range(self.TASK_WORKERS)
+        ]
+    
+    async def _worker_loop(self):
+        """Process queued tasks, highest priority first"""
+        while True:
+            _, _, future, task_request = await self._task_queue.get()
+            try:
+                # The request may have timed out or been cancelled while queued
+                if future.done():
+                    continue
+                
+                # Run as its own task so cancelling the request's future
+                # stops the analysis without stopping this worker
+                work = asyncio.ensure_future(self.process_task(task_request))
+                future.add_done_callback(lambda f, work=work: work.cancel() if f.cancelled() else None)
+                try:
+                    await asyncio.wait((work,))
+                except asyncio.CancelledError:
+                    work.cancel()
+                    raise
+                
+                if future.done() or work.cancelled():
+                    continue
+                if work.exception() is not None:
+                    future.set_exception(work.exception())
+                else:
+                    future.set_result(work.result())
+            finally:
+                self._task_queue.task_done()
+    
+    def _cancel_tasks(self, task_ids: List[str]) -> List[str]:
+        """
+        Cancel each of the given tasks that is still queued or running
+        
+        Args:
+            task_ids: Task identifiers
+            
+        Returns:
+            IDs of the tasks whose work was stopped
+        """
+        cancelled = []
+        for task_id in task_ids:
+            future = self._task_futures.get(task_id)
+            if future is None or not future.cancel():
+                continue
+            self.cancel_task(task_id)
+            cancelled.append(task_id)
+        return cancelled
+    
+    def _rpc_response(self, payload: Dict[str, Any], content_type: Optional[str]) -> Response:
+        """
+        Encode a JSON-RPC response in the same format as the request
+        
+        Args:
+            payload: JSON-RPC response body
+            content_type: Content type of the incoming request
+            
+        Returns:
+            msgpack or JSON response
+        """
+        if is_msgpack(content_type):
+            return Response(
+                content=encode_body(payload, MSGPACK_CONTENT_TYPE),
+                media_type=MSGPACK_CONTENT_TYPE
+            )
+        return ORJSONResponse(payload)
+    
     async def start(self) -> bool:
         """
         Start the remote agent
@@ -183,15 +360,20 @@ class RemoteAgent(BaseAgent):
             # Start the HTTP server
             import uvicorn
             
+            # C HTTP parser and no per-request access log line; the event
+            # loop is the caller's (see a2a_protocol.event_loop)
             config = uvicorn.Config(
                 self.app,
                 host="0.0.0.0",
                 port=self.port,
-                log_level="info"
+                http="httptools",
+                log_level="warning",
+                access_log=False
             )
             self.server = uvicorn.Server(config)
             
-            # Start server in background
+            # Start task workers and the server in background
+            self._start_workers()
             self.server_task = asyncio.create_task(self.server.serve())
             
             self.update_status("active")
@@ -221,6 +403,12 @@ class RemoteAgent(BaseAgent):
                 except asyncio.CancelledError:
                     pass
             
+            # Stop task workers
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            
             # Cancel any running tasks
             for task_id in list(self.active_tasks.keys()):
                 self.cancel_task(task_id)
@@ -251,13 +439,17 @@ class RemoteAgent(BaseAgent):
             if not self.validate_task_parameters(task_params):
                 raise ValueError("Invalid task parameters")
             
-            # Create task
-            self.create_task("analyze_code", task_params)
+            # Create task under the request ID, so cancel requests find it
+            self.create_task("analyze_code", task_params, task_id)
             self.update_task_status(task_id, TaskStatus.RUNNING)
             
             # Process the task (implemented by subclasses)
             result = await self.analyze_code(task_params)
             
+            # Keep the status of a task cancelled while it finished
+            if self.active_tasks[task_id].status == TaskStatus.CANCELLED:
+                return None
+            
             # Update task status
             if result:
                 self.update_task_status(task_id, TaskStatus.COMPLETED, result=result.dict())
@@ -5,12 +5,17 @@ This module implements the main coordinator agent that orchestrates
 code analysis across multiple specialized remote agents.
 """
 
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from contextlib import aclosing
+from itertools import count
+from typing import Dict, Any, Mapping, Optional, List
 from datetime import datetime
 import asyncio
+import logging
+import time
 from agents.base.client_agent import ClientAgent
 from .task_distributor import TaskDistributor
-from .result_aggregator import ResultAggregator
+from .result_aggregator import PartialAggregation, ResultAggregator
 from .orchestration_engine import OrchestrationEngine
 from a2a_protocol.message_schema import AnalysisResult, TaskStatus
 from registry.agent_registry import AgentRegistry
@@ -25,10 +30,17 @@ class CoordinatorAgent(ClientAgent):
     remote agents and aggregating their results.
     """
     
+    # Analysis IDs share one timestamp prefix per second plus a sequence
+    # number, so the prefix is only formatted when the second changes
+    _analysis_sequence = count(1)
+    _id_prefix_second: Optional[int] = None
+    _id_prefix = ""
+    
     def __init__(
         self, 
         registry: AgentRegistry,
-        timeout: int = 60
+        timeout: int = 60,
+        trusted_peers: bool = False
     ):
         """
         Initialize coordinator agent
@@ -36,8 +48,11 @@ class CoordinatorAgent(ClientAgent):
         Args:
             registry: Agent registry for discovery
             timeout: Request timeout in seconds
+            trusted_peers: Skip validation of agent responses
         """
-        super().__init__("coordinator-001", "Code Review Coordinator", registry, timeout)
+        super().__init__(
+            "coordinator-001", "Code Review Coordinator", registry, timeout, trusted_peers
+        )
         
         # Initialize components
         self.task_distributor = TaskDistributor(registry)
@@ -69,6 +84,8 @@ class CoordinatorAgent(ClientAgent):
                 "priority": 5
             }
         }
+        # Read-only view handed out to callers instead of a fresh copy
+        self._analysis_config_view = MappingProxyType(self.analysis_config)
         
         self.logger.info("Initialized Code Review Coordinator")
     
@@ -85,8 +102,8 @@ class CoordinatorAgent(ClientAgent):
             Comprehensive analysis results
         """
         try:
-            analysis_id = f"analysis_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-            self.logger.info(f"Starting comprehensive code analysis: {analysis_id}")
+            analysis_id = self._next_analysis_id()
+            started_at = time.perf_counter()
             
             # Prepare task parameters
             task_params = {
@@ -105,24 +122,40 @@ class CoordinatorAgent(ClientAgent):
             if not distributed_tasks:
                 raise Exception("No agents available for analysis")
             
-            self.logger.info(f"Distributed {len(distributed_tasks)} analysis tasks")
-            
-            # Wait for all tasks to complete
-            results = await self.wait_for_completion(
-                list(distributed_tasks.values()),
-                timeout=self.timeout
-            )
+            # Aggregate results as they arrive, stopping early on a blocking
+            # critical error
+            analysis_types = {task_id: analysis_type for analysis_type, task_id in distributed_tasks.items()}
+            partial = PartialAggregation()
+            async with aclosing(self.iter_task_results(list(analysis_types), timeout=self.timeout)) as completed:
+                async for task_id, result in completed:
+                    self.result_aggregator.merge_partial(partial, task_id, result)
+                    
+                    analysis_type = analysis_types[task_id]
+                    if self.orchestration_engine.should_stop_early(analysis_type, result):
+                        self.logger.warning(f"Critical {analysis_type} error, cancelling remaining tasks")
+                        await self.cancel_remote_tasks(
+                            pending_id for pending_id in analysis_types if pending_id not in partial.results
+                        )
+                        break
             
             # Aggregate results from all agents
-            aggregated_result = self.result_aggregator.aggregate_results(results)
+            aggregated_result = self.result_aggregator.finalize(partial)
             
-            # Apply orchestration rules
-            final_result = self.orchestration_engine.apply_orchestration_rules(
+            # Apply orchestration rules; this is pure CPU work, so run it in
+            # a worker thread to keep the event loop serving other requests
+            final_result = await asyncio.to_thread(
+                self.orchestration_engine.apply_orchestration_rules,
                 aggregated_result, 
                 analysis_id
             )
             
-            self.logger.info(f"Completed comprehensive analysis: {analysis_id}")
+            # One summary record per analysis instead of one per phase
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Completed comprehensive analysis {analysis_id}: "
+                    f"{len(distributed_tasks)} tasks, {partial.successful_agents} results "
+                    f"in {time.perf_counter() - started_at:.2f}s"
+                )
             return final_result
             
         except Exception as e:
@@ -140,6 +173,20 @@ class CoordinatorAgent(ClientAgent):
                 }
             }
     
+    @classmethod
+    def _next_analysis_id(cls) -> str:
+        """
+        Generate a unique analysis identifier
+        
+        Returns:
+            Identifier of the form analysis_<YYYYmmdd_HHMMSS>_<sequence>
+        """
+        now = int(time.time())
+        if now != cls._id_prefix_second:
+            cls._id_prefix_second = now
+            cls._id_prefix = f"analysis_{datetime.utcfromtimestamp(now):%Y%m%d_%H%M%S}_"
+        return f"{cls._id_prefix}{next(cls._analysis_sequence)}"
+    
     async def analyze_specific_aspect(
         self, 
         code: str, 
@@ -232,14 +279,14 @@ class CoordinatorAgent(ClientAgent):
             self.logger.error(f"Failed to connect to registry: {e}")
             return False
     
-    def get_analysis_capabilities(self) -> Dict[str, Dict[str, Any]]:
+    def get_analysis_capabilities(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get available analysis capabilities
         
         Returns:
-            Dictionary of analysis capabilities and their configurations
+            Read-only mapping of analysis capabilities and their configurations
         """
-        return self.analysis_config.copy()
+        return self._analysis_config_view
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -5,13 +5,93 @@ This module implements workflow orchestration logic for the coordinator agent.
 Manages task dependencies, execution order, and result processing.
 """
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from collections import Counter
+from itertools import chain
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import logging
+import time
+import numpy as np
+from a2a_protocol.message_schema import AnalysisResult
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Score category for each error and observation type
+_ERROR_SCORE_CATEGORIES = {
+    "syntax_error": "syntax",
+    "indentation_error": "syntax",
+    "sql_injection": "security",
+    "xss_vulnerability": "security",
+    "hardcoded_secret": "security"
+}
+_OBSERVATION_SCORE_CATEGORIES = {
+    "performance_issue": "performance",
+    "missing_docstring": "documentation",
+    "poor_naming": "documentation",
+    "missing_test": "test_coverage"
+}
+
+# Sort priority per error type (lower number = higher priority)
+_ERROR_PRIORITIES = {
+    "syntax_error": 1,
+    "indentation_error": 1,
+    "sql_injection": 2,
+    "xss_vulnerability": 2,
+    "hardcoded_secret": 2,
+    "memory_leak": 3,
+    "infinite_loop": 3,
+    "performance_bottleneck": 4,
+    "missing_docstring": 5,
+    "poor_naming": 5,
+    "missing_test": 6
+}
+_DEFAULT_ERROR_PRIORITY = 10
+_error_priority = _ERROR_PRIORITIES.get
+
+# Points deducted from a category score per matching issue
+_SCORE_PENALTIES = {
+    "syntax": 20,
+    "security": 30,
+    "performance": 10,
+    "documentation": 5,
+    "test_coverage": 15
+}
+_SCORE_CATEGORIES = tuple(_SCORE_PENALTIES)
+
+# (score key, threshold, recommendation type, priority, message, action);
+# a recommendation is made when the score falls below the threshold
+_RECOMMENDATION_RULES = (
+    ("syntax", 80, "syntax", "high",
+     "Fix syntax errors to improve code quality", "review_and_fix_syntax_errors"),
+    ("security", 70, "security", "critical",
+     "Address security vulnerabilities immediately", "review_security_issues"),
+    ("performance", 60, "performance", "medium",
+     "Optimize code for better performance", "review_performance_suggestions"),
+    ("documentation", 50, "documentation", "low",
+     "Improve code documentation", "add_documentation"),
+    ("test_coverage", 60, "testing", "medium",
+     "Increase test coverage", "add_more_tests"),
+    ("overall", 50, "general", "high",
+     "Overall code quality needs significant improvement", "comprehensive_code_review")
+)
+_SCORE_PENALTY_VECTOR = np.array([_SCORE_PENALTIES[c] for c in _SCORE_CATEGORIES], dtype=np.int32)
+
+
+def _error_sort_key(error: Dict[str, Any]) -> Tuple:
+    """Sort key ordering errors by priority, then line number"""
+    return (
+        _error_priority(error.get("type", ""), _DEFAULT_ERROR_PRIORITY),
+        error.get("line_number", 0)
+    )
+
+
+def _suggestion_sort_key(suggestion: Dict[str, Any]) -> Tuple:
+    """Sort key ordering suggestions by priority, then impact"""
+    return (suggestion.get("priority", 5), suggestion.get("impact", "low"))
+
 
 class ExecutionStrategy(str, Enum):
     """Execution strategy enumeration"""
@@ -28,14 +108,33 @@ class OrchestrationEngine:
     for complex multi-agent analysis workflows.
     """
     
+    __slots__ = (
+        "logger",
+        "execution_strategy",
+        "_strategy_name",
+        "task_dependencies",
+        "result_processing_rules",
+        "_task_dependencies_view",
+        "_result_processing_rules_view",
+        "_all_critical_types"
+    )
+    
     def __init__(self):
         """Initialize orchestration engine"""
         self.logger = get_logger(__name__)
         
         # Workflow configuration
         self.execution_strategy = ExecutionStrategy.PARALLEL
+        # Plain string copied into every orchestration metadata block
+        self._strategy_name = self.execution_strategy.value
         self.task_dependencies = self._define_task_dependencies()
         self.result_processing_rules = self._define_result_processing_rules()
+        self._task_dependencies_view = MappingProxyType(self.task_dependencies)
+        self._result_processing_rules_view = MappingProxyType(self.result_processing_rules)
+        # Error types that are critical for any analysis type
+        self._all_critical_types = frozenset().union(
+            *(rules["critical_errors"] for rules in self.result_processing_rules.values())
+        )
         
         self.logger.info("Initialized Orchestration Engine")
     
@@ -89,6 +188,24 @@ class OrchestrationEngine:
             }
         }
     
+    def should_stop_early(self, analysis_type: str, result: AnalysisResult) -> bool:
+        """
+        Check whether a partial result makes the remaining analyses moot
+        
+        Args:
+            analysis_type: Analysis type that produced the result
+            result: Result for that analysis type
+            
+        Returns:
+            True if the result has a critical error for a rule with stop_on_critical
+        """
+        rules = self.result_processing_rules.get(analysis_type)
+        if not rules or not rules.get("stop_on_critical"):
+            return False
+        
+        critical_errors = rules.get("critical_errors", [])
+        return any(error.get("type", "") in critical_errors for error in result.errors)
+    
     def apply_orchestration_rules(
         self, 
         aggregated_result: Dict[str, Any], 
@@ -97,18 +214,19 @@ class OrchestrationEngine:
         """
         Apply orchestration rules to aggregated results
         
+        The result is updated in place; ResultAggregator hands over a
+        freshly built dict, so there is nothing to protect by copying.
+        
         Args:
-            aggregated_result: Aggregated analysis results
+            aggregated_result: Aggregated analysis results, owned by the caller
             analysis_id: Analysis identifier
             
         Returns:
             Processed results with orchestration applied
         """
         try:
-            self.logger.info(f"Applying orchestration rules for analysis: {analysis_id}")
-            
-            # Create a copy of the result to modify
-            processed_result = aggregated_result.copy()
+            started_at = time.perf_counter()
+            processed_result = aggregated_result
             
             # Apply critical error handling
             processed_result = self._handle_critical_errors(processed_result)
@@ -123,69 +241,129 @@ class OrchestrationEngine:
             processed_result = self._generate_recommendations(processed_result)
             
             # Add orchestration metadata
-            processed_result["orchestration"] = {
-                "analysis_id": analysis_id,
-                "execution_strategy": self.execution_strategy.value,
-                "processed_at": datetime.utcnow().isoformat(),
-                "rules_applied": list(self.result_processing_rules.keys())
-            }
+            processed_result["orchestration"] = self._orchestration_metadata(analysis_id)
             
-            self.logger.info("Successfully applied orchestration rules")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Applied orchestration rules for analysis %s in %.3fs",
+                    analysis_id, time.perf_counter() - started_at
+                )
             return processed_result
             
         except Exception as e:
             self.logger.error(f"Error applying orchestration rules: {e}")
             return aggregated_result
     
-    def _handle_critical_errors(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def apply_orchestration_rules_bulk(
+        self, 
+        aggregated_results: List[Dict[str, Any]], 
+        analysis_ids: List[str]
+    ) -> List[Dict[str, Any]]:
         """
-        Handle critical errors based on orchestration rules
+        Apply orchestration rules to a batch of aggregated results
+        
+        Produces the same output as calling apply_orchestration_rules on
+        each result, but scores the whole batch in one vectorized step.
         
         Args:
-            result: Analysis result
+            aggregated_results: Aggregated analysis results, one per file
+            analysis_ids: Analysis identifier for each result
             
         Returns:
-            Result with critical error handling applied
+            Processed results in the same order
         """
         try:
-            errors = result.get("errors", [])
-            critical_errors = []
-            non_critical_errors = []
+            started_at = time.perf_counter()
             
-            # Categorize errors by criticality
-            for error in errors:
-                error_type = error.get("type", "")
-                
-                # Check if this is a critical error for any analysis type
-                is_critical = False
-                for analysis_type, rules in self.result_processing_rules.items():
-                    if error_type in rules.get("critical_errors", []):
-                        is_critical = True
-                        break
-                
-                if is_critical:
-                    critical_errors.append(error)
-                else:
-                    non_critical_errors.append(error)
+            # Work on copies so the per-result fallback below sees the originals
+            processed_results = [
+                self._prioritize_results(self._handle_critical_errors(result.copy()))
+                for result in aggregated_results
+            ]
             
-            # Update result with categorized errors
-            result["errors"] = {
-                "critical": critical_errors,
-                "non_critical": non_critical_errors
-            }
+            self._calculate_quality_scores_bulk(processed_results)
             
-            # Add critical error summary
-            result["critical_error_summary"] = {
-                "count": len(critical_errors),
-                "types": list(set(error.get("type", "") for error in critical_errors)),
-                "requires_immediate_attention": len(critical_errors) > 0
-            }
+            for processed_result, analysis_id in zip(processed_results, analysis_ids):
+                self._generate_recommendations(processed_result)
+                processed_result["orchestration"] = self._orchestration_metadata(analysis_id)
             
-            return result
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Applied orchestration rules to %d analyses in %.3fs",
+                    len(processed_results), time.perf_counter() - started_at
+                )
+            return processed_results
             
         except Exception as e:
-            self.logger.error(f"Error handling critical errors: {e}")
-            return result
+            self.logger.error(f"Error applying bulk orchestration rules: {e}")
+            return [
+                self.apply_orchestration_rules(result, analysis_id)
+                for result, analysis_id in zip(aggregated_results, analysis_ids)
+            ]
+    
+    def _orchestration_metadata(self, analysis_id: str) -> Dict[str, Any]:
+        """Build the orchestration metadata block for a processed result"""
+        return {
+            "analysis_id": analysis_id,
+            "execution_strategy": self._strategy_name,
+            "processed_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "rules_applied": list(self.result_processing_rules.keys())
+        }
+    
+    def _handle_critical_errors(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle critical errors based on orchestration rules
+        
+        Args:
+            result: Analysis result
+            
+        Returns:
+            Result with critical error handling applied
+        """
+        # Categorize errors by criticality
+        critical_errors, non_critical_errors = self._split_errors(result.get("errors", []))
+        
+        # Update result with categorized errors
+        result["errors"] = {
+            "critical": critical_errors,
+            "non_critical": non_critical_errors
+        }
+        
+        # Add critical error summary
+        result["critical_error_summary"] = {
+            "count": len(critical_errors),
+            "types": list({error.get("type", "") for error in critical_errors}),
+            "requires_immediate_attention": len(critical_errors) > 0
+        }
+        
+        return result
+    
+    def _split_errors(self, errors: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split errors into critical and non-critical lists
+        
+        Accepts either the flat list produced by the aggregator or the
+        categorized dict produced by _handle_critical_errors.
+        
+        Args:
+            errors: Errors in either shape
+            
+        Returns:
+            Critical errors and non-critical errors
+        """
+        if isinstance(errors, dict):
+            return errors.get("critical", []), errors.get("non_critical", [])
+        
+        critical_errors = []
+        non_critical_errors = []
+        critical_types = self._all_critical_types
+        for error in errors:
+            # Check if this is a critical error for any analysis type
+            if error.get("type", "") in critical_types:
+                critical_errors.append(error)
+            else:
+                non_critical_errors.append(error)
+        return critical_errors, non_critical_errors
     
     def _prioritize_results(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -197,49 +375,56 @@ class OrchestrationEngine:
         Returns:
             Result with prioritization applied
         """
-        try:
-            # Prioritize errors by severity and type
-            errors = result.get("errors", {})
-            if isinstance(errors, list):
-                # Convert to dict format if needed
-                errors = {"critical": errors, "non_critical": []}
-            
-            # Sort critical errors by severity
-            if "critical" in errors:
-                errors["critical"].sort(
-                    key=lambda x: (
-                        self._get_error_priority(x.get("type", "")),
-                        x.get("line_number", 0)
-                    )
-                )
-            
-            # Sort non-critical errors by severity
-            if "non_critical" in errors:
-                errors["non_critical"].sort(
-                    key=lambda x: (
-                        self._get_error_priority(x.get("type", "")),
-                        x.get("line_number", 0)
-                    )
-                )
-            
-            result["errors"] = errors
-            
-            # Prioritize suggestions by impact
-            suggestions = result.get("suggestions", [])
-            suggestions.sort(
-                key=lambda x: (
-                    x.get("priority", 5),
-                    x.get("impact", "low")
-                ),
-                reverse=True
-            )
-            result["suggestions"] = suggestions
-            
-            return result
+        # Prioritize errors by severity and type
+        critical_errors, non_critical_errors = self._split_errors(result.get("errors", {}))
+        critical_errors.sort(key=_error_sort_key)
+        non_critical_errors.sort(key=_error_sort_key)
+        
+        result["errors"] = {
+            "critical": critical_errors,
+            "non_critical": non_critical_errors
+        }
+        
+        # Prioritize suggestions by impact
+        suggestions = result.get("suggestions", [])
+        suggestions.sort(key=_suggestion_sort_key, reverse=True)
+        result["suggestions"] = suggestions
+        
+        return result
+    
+    def _count_quality_issues(self, result: Dict[str, Any]) -> Tuple[List[int], int, int]:
+        """
+        Count the issues that feed the quality scores
+        
+        Args:
+            result: Analysis result
             
-        except Exception as e:
-            self.logger.error(f"Error prioritizing results: {e}")
-            return result
+        Returns:
+            Per-category issue counts in _SCORE_CATEGORIES order, total
+            issues and critical issues
+        """
+        critical_errors, non_critical_errors = self._split_errors(result.get("errors", {}))
+        observations = result.get("observations", [])
+        
+        critical_issues = len(critical_errors)
+        total_issues = critical_issues + len(non_critical_errors) + len(observations)
+        
+        # Index each list by type once, then map the distinct types to
+        # score categories
+        error_types = Counter(error.get("type") for error in chain(critical_errors, non_critical_errors))
+        observation_types = Counter(obs.get("type") for obs in observations)
+        
+        issue_counts = dict.fromkeys(_SCORE_CATEGORIES, 0)
+        for type_counts, categories in (
+            (error_types, _ERROR_SCORE_CATEGORIES),
+            (observation_types, _OBSERVATION_SCORE_CATEGORIES)
+        ):
+            for issue_type, type_count in type_counts.items():
+                category = categories.get(issue_type)
+                if category:
+                    issue_counts[category] += type_count
+        
+        return list(issue_counts.values()), total_issues, critical_issues
     
     def _calculate_quality_scores(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -251,57 +436,65 @@ class OrchestrationEngine:
         Returns:
             Result with quality scores added
         """
-        try:
-            errors = result.get("errors", {})
-            observations = result.get("observations", [])
-            suggestions = result.get("suggestions", [])
-            
-            # Calculate base quality score
-            total_issues = 0
-            critical_issues = 0
-            
-            if isinstance(errors, dict):
-                critical_errors = errors.get("critical", [])
-                non_critical_errors = errors.get("non_critical", [])
-                total_issues += len(critical_errors) + len(non_critical_errors)
-                critical_issues += len(critical_errors)
-            else:
-                total_issues += len(errors)
-            
-            # Add observations to total issues
-            total_issues += len(observations)
-            
-            # Calculate component scores
-            syntax_score = self._calculate_syntax_score(errors)
-            security_score = self._calculate_security_score(errors)
-            performance_score = self._calculate_performance_score(observations)
-            documentation_score = self._calculate_documentation_score(observations)
-            test_score = self._calculate_test_score(observations)
-            
-            # Calculate overall quality score
-            component_scores = [syntax_score, security_score, performance_score, documentation_score, test_score]
-            overall_score = sum(component_scores) / len(component_scores) if component_scores else 0
-            
-            # Apply penalty for critical issues
-            if critical_issues > 0:
-                overall_score *= max(0.1, 1 - (critical_issues * 0.2))
+        issue_counts, total_issues, critical_issues = self._count_quality_issues(result)
+        
+        # Calculate component scores
+        scores = [
+            max(0, 100 - count * _SCORE_PENALTIES[category])
+            for category, count in zip(_SCORE_CATEGORIES, issue_counts)
+        ]
+        
+        # Calculate overall quality score
+        overall_score = sum(scores) / len(scores)
+        
+        # Apply penalty for critical issues
+        if critical_issues > 0:
+            overall_score *= max(0.1, 1 - (critical_issues * 0.2))
+        
+        result["quality_scores"] = {
+            "overall": round(overall_score, 2),
+            **dict(zip(_SCORE_CATEGORIES, scores)),
+            "total_issues": total_issues,
+            "critical_issues": critical_issues
+        }
+        
+        return result
+    
+    def _calculate_quality_scores_bulk(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculate quality scores for a batch of results with NumPy
+        
+        Args:
+            results: Analysis results, updated in place
             
+        Returns:
+            The same results with quality scores added
+        """
+        if not results:
+            return results
+        
+        counted = [self._count_quality_issues(result) for result in results]
+        counts = np.array([c[0] for c in counted], dtype=np.int32)
+        critical = np.array([c[2] for c in counted], dtype=np.int32)
+        
+        # Component scores for every result at once, shape (N, categories)
+        scores = np.maximum(0, 100 - counts * _SCORE_PENALTY_VECTOR)
+        overall = scores.mean(axis=1)
+        
+        # Apply penalty for critical issues
+        overall *= np.where(critical > 0, np.maximum(0.1, 1 - critical * 0.2), 1.0)
+        
+        for result, (_, total_issues, critical_issues), row, overall_score in zip(
+            results, counted, scores.tolist(), overall.tolist()
+        ):
             result["quality_scores"] = {
                 "overall": round(overall_score, 2),
-                "syntax": syntax_score,
-                "security": security_score,
-                "performance": performance_score,
-                "documentation": documentation_score,
-                "test_coverage": test_score,
+                **dict(zip(_SCORE_CATEGORIES, row)),
                 "total_issues": total_issues,
                 "critical_issues": critical_issues
             }
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating quality scores: {e}")
-            return result
+        
+        return results
     
     def _generate_recommendations(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -313,123 +506,23 @@ class OrchestrationEngine:
         Returns:
             Result with recommendations added
         """
-        try:
-            recommendations = []
-            quality_scores = result.get("quality_scores", {})
-            
-            # Generate recommendations based on quality scores
-            if quality_scores.get("syntax", 100) < 80:
-                recommendations.append({
-                    "type": "syntax",
-                    "priority": "high",
-                    "message": "Fix syntax errors to improve code quality",
-                    "action": "review_and_fix_syntax_errors"
-                })
-            
-            if quality_scores.get("security", 100) < 70:
-                recommendations.append({
-                    "type": "security",
-                    "priority": "critical",
-                    "message": "Address security vulnerabilities immediately",
-                    "action": "review_security_issues"
-                })
-            
-            if quality_scores.get("performance", 100) < 60:
-                recommendations.append({
-                    "type": "performance",
-                    "priority": "medium",
-                    "message": "Optimize code for better performance",
-                    "action": "review_performance_suggestions"
-                })
-            
-            if quality_scores.get("documentation", 100) < 50:
-                recommendations.append({
-                    "type": "documentation",
-                    "priority": "low",
-                    "message": "Improve code documentation",
-                    "action": "add_documentation"
-                })
-            
-            if quality_scores.get("test_coverage", 100) < 60:
-                recommendations.append({
-                    "type": "testing",
-                    "priority": "medium",
-                    "message": "Increase test coverage",
-                    "action": "add_more_tests"
-                })
-            
-            # Add general recommendations
-            if quality_scores.get("overall", 100) < 50:
-                recommendations.append({
-                    "type": "general",
-                    "priority": "high",
-                    "message": "Overall code quality needs significant improvement",
-                    "action": "comprehensive_code_review"
-                })
-            
-            result["recommendations"] = recommendations
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error generating recommendations: {e}")
-            return result
-    
-    def _get_error_priority(self, error_type: str) -> int:
-        """Get priority for error type (lower number = higher priority)"""
-        priority_map = {
-            "syntax_error": 1,
-            "indentation_error": 1,
-            "sql_injection": 2,
-            "xss_vulnerability": 2,
-            "hardcoded_secret": 2,
-            "memory_leak": 3,
-            "infinite_loop": 3,
-            "performance_bottleneck": 4,
-            "missing_docstring": 5,
-            "poor_naming": 5,
-            "missing_test": 6
-        }
-        return priority_map.get(error_type, 10)
-    
-    def _calculate_syntax_score(self, errors: Any) -> float:
-        """Calculate syntax quality score"""
-        if isinstance(errors, dict):
-            critical_errors = errors.get("critical", [])
-            non_critical_errors = errors.get("non_critical", [])
-            syntax_errors = [e for e in critical_errors + non_critical_errors 
-                           if e.get("type") in ["syntax_error", "indentation_error"]]
-        else:
-            syntax_errors = [e for e in errors if e.get("type") in ["syntax_error", "indentation_error"]]
-        
-        return max(0, 100 - len(syntax_errors) * 20)
-    
-    def _calculate_security_score(self, errors: Any) -> float:
-        """Calculate security quality score"""
-        if isinstance(errors, dict):
-            critical_errors = errors.get("critical", [])
-            non_critical_errors = errors.get("non_critical", [])
-            security_errors = [e for e in critical_errors + non_critical_errors 
-                             if e.get("type") in ["sql_injection", "xss_vulnerability", "hardcoded_secret"]]
-        else:
-            security_errors = [e for e in errors if e.get("type") in ["sql_injection", "xss_vulnerability", "hardcoded_secret"]]
-        
-        return max(0, 100 - len(security_errors) * 30)
-    
-    def _calculate_performance_score(self, observations: List[Dict[str, Any]]) -> float:
-        """Calculate performance quality score"""
-        performance_issues = [obs for obs in observations if obs.get("type") == "performance_issue"]
-        return max(0, 100 - len(performance_issues) * 10)
-    
-    def _calculate_documentation_score(self, observations: List[Dict[str, Any]]) -> float:
-        """Calculate documentation quality score"""
-        doc_issues = [obs for obs in observations if obs.get("type") in ["missing_docstring", "poor_naming"]]
-        return max(0, 100 - len(doc_issues) * 5)
-    
-    def _calculate_test_score(self, observations: List[Dict[str, Any]]) -> float:
-        """Calculate test coverage quality score"""
-        test_issues = [obs for obs in observations if obs.get("type") == "missing_test"]
-        return max(0, 100 - len(test_issues) * 15)
+        quality_scores = result.get("quality_scores", {})
+        
+        # Generate recommendations based on quality scores
+        recommendations = [
+            {
+                "type": recommendation_type,
+                "priority": priority,
+                "message": message,
+                "action": action
+            }
+            for score_key, threshold, recommendation_type, priority, message, action in _RECOMMENDATION_RULES
+            if quality_scores.get(score_key, 100) < threshold
+        ]
+        
+        result["recommendations"] = recommendations
+        
+        return result
     
     def get_execution_strategy(self) -> ExecutionStrategy:
         """Get current execution strategy"""
@@ -443,12 +536,13 @@ class OrchestrationEngine:
             strategy: New execution strategy
         """
         self.execution_strategy = strategy
+        self._strategy_name = strategy.value
         self.logger.info(f"Execution strategy changed to: {strategy.value}")
     
-    def get_task_dependencies(self) -> Dict[str, List[str]]:
-        """Get task dependencies configuration"""
-        return self.task_dependencies.copy()
+    def get_task_dependencies(self) -> Mapping[str, List[str]]:
+        """Get read-only view of the task dependencies configuration"""
+        return self._task_dependencies_view
     
-    def get_result_processing_rules(self) -> Dict[str, Dict[str, Any]]:
-        """Get result processing rules"""
-        return self.result_processing_rules.copy()
+    def get_result_processing_rules(self) -> Mapping[str, Dict[str, Any]]:
+        """Get read-only view of the result processing rules"""
+        return self._result_processing_rules_view
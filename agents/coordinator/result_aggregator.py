@@ -5,14 +5,58 @@ This module implements result aggregation logic for the coordinator agent.
 Combines and synthesizes results from multiple remote agents.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+import heapq
+from dataclasses import dataclass, field
 from a2a_protocol.message_schema import AnalysisResult, TaskStatus
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_COMPLETED = TaskStatus.COMPLETED
+_utcnow = datetime.utcnow
+
+# Severity levels from most to least severe; a level's priority is its
+# 1-based position (lower number = more severe)
+_SEVERITY_ORDER = ("critical", "error", "warning", "info", "debug")
+_SEVERITY_PRIORITIES = {severity: i for i, severity in enumerate(_SEVERITY_ORDER, 1)}
+_DEFAULT_SEVERITY_PRIORITY = _SEVERITY_PRIORITIES["info"]
+
+
+@lru_cache(maxsize=32)
+def _severity_priority(severity: str) -> int:
+    """Get numeric priority for a severity level"""
+    return _SEVERITY_PRIORITIES.get(severity.lower(), _DEFAULT_SEVERITY_PRIORITY)
+
+
+def _observation_sort_key(observation: Dict[str, Any]) -> Tuple[int, int]:
+    """Sort key ordering observations by severity, then line number"""
+    return (_severity_priority(observation.get('severity', 'info')), observation.get('line_number', 0))
+
+
+def _suggestion_priority(suggestion: Dict[str, Any]) -> int:
+    """Sort key ranking suggestions by priority"""
+    return suggestion.get('priority', 5)
+
+
+def _error_sort_key(error: Dict[str, Any]) -> Tuple[int, int]:
+    """Sort key ordering errors by severity, then line number"""
+    return (_severity_priority(error.get('severity', 'error')), error.get('line_number', 0))
+
+
+@dataclass(slots=True)
+class PartialAggregation:
+    """Results collected so far for an analysis that is still running"""
+    results: Dict[str, Optional[AnalysisResult]] = field(default_factory=dict)
+    observations: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    suggestions: List[Dict[str, Any]] = field(default_factory=list)
+    agent_metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    successful_agents: int = 0
+
 
 class ResultAggregator:
     """
@@ -44,7 +88,7 @@ class ResultAggregator:
             results: Dictionary mapping agent IDs to analysis results
             
         Returns:
-            Aggregated analysis result
+            Newly built aggregated analysis result, owned by the caller
         """
         try:
             if not results:
@@ -52,26 +96,63 @@ class ResultAggregator:
             
             self.logger.info(f"Aggregating results from {len(results)} agents")
             
-            # Extract all observations, errors, and suggestions
-            all_observations = []
-            all_errors = []
-            all_suggestions = []
-            agent_metadata = {}
-            
+            partial = PartialAggregation()
             for agent_id, result in results.items():
-                if result and result.status == TaskStatus.COMPLETED:
-                    all_observations.extend(result.observations)
-                    all_errors.extend(result.errors)
-                    all_suggestions.extend(result.suggestions)
-                    agent_metadata[agent_id] = result.metadata
+                self.merge_partial(partial, agent_id, result)
+            
+            return self.finalize(partial)
+            
+        except Exception as e:
+            self.logger.error(f"Error aggregating results: {e}")
+            return self._create_error_result(str(e))
+    
+    def merge_partial(
+        self, 
+        partial: PartialAggregation, 
+        agent_id: str, 
+        result: Optional[AnalysisResult]
+    ) -> PartialAggregation:
+        """
+        Fold one agent's result into a running aggregation
+        
+        Args:
+            partial: Aggregation collected so far
+            agent_id: Agent (or task) identifier the result belongs to
+            result: Analysis result from that agent
+            
+        Returns:
+            The updated aggregation
+        """
+        partial.results[agent_id] = result
+        if result and result.status == _COMPLETED:
+            partial.observations.extend(result.observations)
+            partial.errors.extend(result.errors)
+            partial.suggestions.extend(result.suggestions)
+            partial.agent_metadata[agent_id] = result.metadata
+            partial.successful_agents += 1
+        return partial
+    
+    def finalize(self, partial: PartialAggregation) -> Dict[str, Any]:
+        """
+        Build the aggregated result from a running aggregation
+        
+        Args:
+            partial: Aggregation collected so far
+            
+        Returns:
+            Newly built aggregated analysis result, owned by the caller
+        """
+        try:
+            if not partial.results:
+                return self._create_empty_result()
             
             # Apply aggregation strategies
-            aggregated_observations = self._aggregate_observations(all_observations)
-            aggregated_errors = self._aggregate_errors(all_errors)
-            aggregated_suggestions = self._aggregate_suggestions(all_suggestions)
+            aggregated_observations = self._aggregate_observations(partial.observations)
+            aggregated_errors = self._aggregate_errors(partial.errors)
+            aggregated_suggestions = self._aggregate_suggestions(partial.suggestions)
             
             # Generate corrected code
-            corrected_code = self._generate_corrected_code(results)
+            corrected_code = self._generate_corrected_code(partial.results)
             
             # Calculate summary statistics
             summary = self._calculate_summary_stats(
@@ -82,15 +163,15 @@ class ResultAggregator:
             
             # Create final aggregated result
             aggregated_result = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "total_agents": len(results),
-                "successful_agents": len([r for r in results.values() if r and r.status == TaskStatus.COMPLETED]),
+                "timestamp": _utcnow().isoformat(),
+                "total_agents": len(partial.results),
+                "successful_agents": partial.successful_agents,
                 "observations": aggregated_observations,
                 "errors": aggregated_errors,
                 "suggestions": aggregated_suggestions,
                 "corrected_code": corrected_code,
                 "summary": summary,
-                "agent_metadata": agent_metadata
+                "agent_metadata": partial.agent_metadata
             }
             
             self.logger.info("Successfully aggregated analysis results")
@@ -110,35 +191,27 @@ class ResultAggregator:
         Returns:
             Aggregated observations
         """
-        try:
-            # Group observations by type and location
-            observation_groups = defaultdict(list)
-            
-            for obs in observations:
-                key = f"{obs.get('type', 'unknown')}_{obs.get('line_number', 'unknown')}"
-                observation_groups[key].append(obs)
-            
-            # Merge similar observations
-            aggregated = []
-            for group_observations in observation_groups.values():
-                if len(group_observations) == 1:
-                    aggregated.append(group_observations[0])
-                else:
-                    # Merge multiple observations of the same type/location
-                    merged = self._merge_similar_observations(group_observations)
-                    aggregated.append(merged)
-            
-            # Sort by severity and line number
-            aggregated.sort(key=lambda x: (
-                self._get_severity_priority(x.get('severity', 'info')),
-                x.get('line_number', 0)
-            ))
-            
-            return aggregated
-            
-        except Exception as e:
-            self.logger.error(f"Error aggregating observations: {e}")
-            return observations
+        # Group observations by type and location
+        observation_groups = defaultdict(list)
+        
+        for obs in observations:
+            key = f"{obs.get('type', 'unknown')}_{obs.get('line_number', 'unknown')}"
+            observation_groups[key].append(obs)
+        
+        # Merge similar observations
+        aggregated = []
+        for group_observations in observation_groups.values():
+            if len(group_observations) == 1:
+                aggregated.append(group_observations[0])
+            else:
+                # Merge multiple observations of the same type/location
+                merged = self._merge_similar_observations(group_observations)
+                aggregated.append(merged)
+        
+        # Sort by severity and line number
+        aggregated.sort(key=_observation_sort_key)
+        
+        return aggregated
     
     def _aggregate_errors(self, errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -150,34 +223,22 @@ class ResultAggregator:
         Returns:
             Aggregated errors
         """
-        try:
-            # Remove duplicates and prioritize by severity
-            unique_errors = []
-            seen_errors = set()
-            
-            for error in errors:
-                # Create a key for deduplication
-                error_key = (
-                    error.get('type', ''),
-                    error.get('line_number', 0),
-                    error.get('message', '')[:100]  # First 100 chars for comparison
-                )
-                
-                if error_key not in seen_errors:
-                    seen_errors.add(error_key)
-                    unique_errors.append(error)
-            
-            # Sort by severity and line number
-            unique_errors.sort(key=lambda x: (
-                self._get_severity_priority(x.get('severity', 'error')),
-                x.get('line_number', 0)
-            ))
-            
-            return unique_errors
-            
-        except Exception as e:
-            self.logger.error(f"Error aggregating errors: {e}")
-            return errors
+        # Remove duplicates, keeping the first occurrence of each key
+        dedup = {}
+        for error in errors:
+            # Create a key for deduplication
+            error_key = (
+                error.get('type', ''),
+                error.get('line_number', 0),
+                error.get('message', '')[:100]  # First 100 chars for comparison
+            )
+            dedup.setdefault(error_key, error)
+        unique_errors = list(dedup.values())
+        
+        # Sort by severity and line number
+        unique_errors.sort(key=_error_sort_key)
+        
+        return unique_errors
     
     def _aggregate_suggestions(self, suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -189,32 +250,24 @@ class ResultAggregator:
         Returns:
             Aggregated suggestions
         """
-        try:
-            # Group suggestions by type
-            suggestion_groups = defaultdict(list)
-            
-            for suggestion in suggestions:
-                suggestion_type = suggestion.get('type', 'general')
-                suggestion_groups[suggestion_type].append(suggestion)
-            
-            # Rank suggestions within each group
-            ranked_suggestions = []
-            for suggestion_type, group_suggestions in suggestion_groups.items():
-                # Sort by priority/impact
-                group_suggestions.sort(key=lambda x: x.get('priority', 5), reverse=True)
-                
-                # Take top suggestions from each group
-                top_suggestions = group_suggestions[:3]  # Top 3 per type
-                ranked_suggestions.extend(top_suggestions)
-            
-            # Sort overall by priority
-            ranked_suggestions.sort(key=lambda x: x.get('priority', 5), reverse=True)
-            
-            return ranked_suggestions
-            
-        except Exception as e:
-            self.logger.error(f"Error aggregating suggestions: {e}")
-            return suggestions
+        # Group suggestions by type
+        suggestion_groups = defaultdict(list)
+        
+        for suggestion in suggestions:
+            suggestion_type = suggestion.get('type', 'general')
+            suggestion_groups[suggestion_type].append(suggestion)
+        
+        # Rank suggestions within each group
+        ranked_suggestions = []
+        for group_suggestions in suggestion_groups.values():
+            # Take top suggestions from each group without sorting the rest
+            top_suggestions = heapq.nlargest(3, group_suggestions, key=_suggestion_priority)  # Top 3 per type
+            ranked_suggestions.extend(top_suggestions)
+        
+        # Sort overall by priority
+        ranked_suggestions.sort(key=_suggestion_priority, reverse=True)
+        
+        return ranked_suggestions
     
     def _generate_corrected_code(self, results: Dict[str, AnalysisResult]) -> Optional[str]:
         """
@@ -226,19 +279,12 @@ class ResultAggregator:
         Returns:
             Corrected code or None
         """
-        try:
-            # Find the first agent that provided corrected code
-            for result in results.values():
-                if result and result.corrected_code:
-                    return result.corrected_code
-            
-            # If no agent provided corrected code, return None
-            # In a real implementation, you might apply fixes sequentially
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error generating corrected code: {e}")
-            return None
+        # Use the first agent that provided corrected code, if any
+        # In a real implementation, you might apply fixes sequentially
+        return next(
+            (result.corrected_code for result in results.values() if result and result.corrected_code),
+            None
+        )
     
     def _merge_similar_observations(self, observations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -262,7 +308,7 @@ class ResultAggregator:
         # Combine messages from all observations
         messages = [obs.get('message', '') for obs in observations if obs.get('message')]
         if messages:
-            merged['message'] = ' | '.join(set(messages))  # Remove duplicates
+            merged['message'] = ' | '.join(dict.fromkeys(messages))  # Remove duplicates, keeping order
         
         # Update severity to highest level
         severities = [obs.get('severity', 'info') for obs in observations]
@@ -274,6 +320,70 @@ class ResultAggregator:
         
         return merged
     
+    def summarize_results(self, results: Dict[str, AnalysisResult]) -> Dict[str, Any]:
+        """
+        Calculate summary statistics without building the aggregated lists
+        
+        Severity counts are updated per agent as results are read, so
+        memory stays flat no matter how many findings the agents return.
+        Counts cover every reported item; unlike aggregate_results, no
+        deduplication across agents is applied.
+        
+        Args:
+            results: Dictionary mapping agent IDs to analysis results
+            
+        Returns:
+            Summary statistics in the same shape as aggregate_results' summary
+        """
+        error_counts = Counter()
+        observation_counts = Counter()
+        total_suggestions = 0
+        
+        for result in results.values():
+            if result and result.status == _COMPLETED:
+                error_counts.update(error.get('severity', 'error') for error in result.errors)
+                observation_counts.update(obs.get('severity', 'info') for obs in result.observations)
+                total_suggestions += len(result.suggestions)
+        
+        return self._summary_from_counts(error_counts, observation_counts, total_suggestions)
+    
+    def _summary_from_counts(
+        self, 
+        error_counts: Counter, 
+        observation_counts: Counter, 
+        total_suggestions: int
+    ) -> Dict[str, Any]:
+        """
+        Build summary statistics from severity counts
+        
+        Args:
+            error_counts: Error count per severity
+            observation_counts: Observation count per severity
+            total_suggestions: Number of suggestions
+            
+        Returns:
+            Summary statistics
+        """
+        total_errors = sum(error_counts.values())
+        total_observations = sum(observation_counts.values())
+        
+        # Calculate overall scores
+        total_issues = total_errors + total_observations
+        critical_issues = error_counts.get('critical', 0) + observation_counts.get('critical', 0)
+        
+        # Calculate quality score (0-100)
+        quality_score = max(0, 100 - (total_issues * 2) - (critical_issues * 10))
+        
+        return {
+            "total_observations": total_observations,
+            "total_errors": total_errors,
+            "total_suggestions": total_suggestions,
+            "error_counts": dict(error_counts),
+            "observation_counts": dict(observation_counts),
+            "critical_issues": critical_issues,
+            "quality_score": min(100, max(0, quality_score))
+        }
+    
     def _calculate_summary_stats(
         self, 
         observations: List[Dict[str, Any]], 
@@ -291,78 +401,23 @@ class ResultAggregator:
         Returns:
             Summary statistics
         """
-        try:
-            # Count by severity
-            error_counts = defaultdict(int)
-            for error in errors:
-                severity = error.get('severity', 'error')
-                error_counts[severity] += 1
-            
-            observation_counts = defaultdict(int)
-            for obs in observations:
-                severity = obs.get('severity', 'info')
-                observation_counts[severity] += 1
-            
-            # Calculate overall scores
-            total_issues = len(errors) + len(observations)
-            critical_issues = error_counts.get('critical', 0) + observation_counts.get('critical', 0)
-            
-            # Calculate quality score (0-100)
-            quality_score = max(0, 100 - (total_issues * 2) - (critical_issues * 10))
-            
-            return {
-                "total_observations": len(observations),
-                "total_errors": len(errors),
-                "total_suggestions": len(suggestions),
-                "error_counts": dict(error_counts),
-                "observation_counts": dict(observation_counts),
-                "critical_issues": critical_issues,
-                "quality_score": min(100, max(0, quality_score))
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating summary stats: {e}")
-            return {
-                "total_observations": 0,
-                "total_errors": 0,
-                "total_suggestions": 0,
-                "error_counts": {},
-                "observation_counts": {},
-                "critical_issues": 0,
-                "quality_score": 0
-            }
-    
-    def _get_severity_priority(self, severity: str) -> int:
-        """Get numeric priority for severity level"""
-        severity_map = {
-            "critical": 1,
-            "error": 2,
-            "warning": 3,
-            "info": 4,
-            "debug": 5
-        }
-        return severity_map.get(severity.lower(), 4)
+        # Count by severity
+        error_counts = Counter(error.get('severity', 'error') for error in errors)
+        observation_counts = Counter(obs.get('severity', 'info') for obs in observations)
+        
+        return self._summary_from_counts(error_counts, observation_counts, len(suggestions))
     
     def _get_highest_severity(self, severities: List[str]) -> str:
         """Get the highest severity level from a list"""
         if not severities:
             return "info"
         
-        priority_map = {v: k for k, v in {
-            "critical": 1,
-            "error": 2,
-            "warning": 3,
-            "info": 4,
-            "debug": 5
-        }.items()}
-        
-        min_priority = min(self._get_severity_priority(s) for s in severities)
-        return priority_map.get(min_priority, "info")
+        return _SEVERITY_ORDER[min(_severity_priority(s) for s in severities) - 1]
     
     def _create_empty_result(self) -> Dict[str, Any]:
         """Create empty result when no agents responded"""
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utcnow().isoformat(),
             "total_agents": 0,
             "successful_agents": 0,
             "observations": [],
@@ -384,7 +439,7 @@ class ResultAggregator:
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create error result when aggregation fails"""
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utcnow().isoformat(),
             "total_agents": 0,
             "successful_agents": 0,
             "observations": [],
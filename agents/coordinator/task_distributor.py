@@ -5,8 +5,10 @@ This module implements task distribution logic for the coordinator agent.
 Distributes analysis tasks to appropriate remote agents based on capabilities.
 """
 
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
 from registry.agent_registry import AgentRegistry
 from a2a_protocol.message_schema import AgentInfo
 from utils.logger import get_logger
@@ -35,6 +37,9 @@ class TaskDistributor:
         # Task distribution strategy
         self.distribution_strategy = "capability_based"  # or "round_robin", "load_balanced"
         
+        # Next candidate offset per analysis type, for round-robin selection
+        self._rr_index: Dict[str, int] = defaultdict(int)
+        
         self.logger.info("Initialized Task Distributor")
     
     async def distribute_analysis_tasks(
@@ -55,13 +60,18 @@ class TaskDistributor:
         distributed_tasks = {}
         
         try:
-            for analysis_type, config in analysis_config.items():
-                task_id = await self._distribute_single_task(
-                    analysis_type,
-                    task_params,
-                    config
+            # Dispatch every analysis type at once; health checks and sends
+            # overlap instead of paying one round trip each
+            analysis_types = list(analysis_config)
+            health_checks: Dict[str, asyncio.Task] = {}
+            task_ids = await asyncio.gather(*[
+                self._distribute_single_task(
+                    analysis_type, task_params, analysis_config[analysis_type], health_checks
                 )
-                
+                for analysis_type in analysis_types
+            ])
+            
+            for analysis_type, task_id in zip(analysis_types, task_ids):
                 if task_id:
                     distributed_tasks[analysis_type] = task_id
                     self.logger.info(f"Distributed {analysis_type} task: {task_id}")
@@ -78,7 +88,8 @@ class TaskDistributor:
         self, 
         analysis_type: str, 
         task_params: Dict[str, Any], 
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        health_checks: Optional[Dict[str, asyncio.Task]] = None
     ) -> Optional[str]:
         """
         Distribute a single analysis task
@@ -87,6 +98,8 @@ class TaskDistributor:
             analysis_type: Type of analysis
             task_params: Task parameters
             config: Analysis configuration
+            health_checks: Health checks already started in this distribution
+                round, shared so each agent is probed at most once
             
         Returns:
             Task ID if successful, None otherwise
@@ -95,26 +108,39 @@ class TaskDistributor:
             required_capabilities = config.get("capabilities", [])
             priority = config.get("priority", 1)
             
-            # Find best agent for this analysis type
-            best_agent = self.registry.find_best_agent(required_capabilities)
+            # Rotate through every matching agent so repeated analyses of
+            # the same type spread out instead of always hitting one agent
+            candidates = self.registry.find_candidates(required_capabilities)
             
-            if not best_agent:
+            if not candidates:
                 self.logger.warning(f"No agent found for {analysis_type} with capabilities: {required_capabilities}")
                 return None
             
-            # Check agent health
-            is_healthy = await self.registry.check_agent_health(best_agent.agent_id)
-            if not is_healthy:
-                self.logger.warning(f"Agent {best_agent.agent_id} is unhealthy, skipping {analysis_type}")
-                return None
+            start = self._rr_index[analysis_type] % len(candidates)
+            self._rr_index[analysis_type] = start + 1
             
-            # Check agent capacity
-            agent_stats = self.registry.agent_status.get(best_agent.agent_id, {})
-            active_tasks = agent_stats.get("active_tasks", 0)
-            max_concurrent = getattr(best_agent, 'max_concurrent_tasks', 5)
+            best_agent = None
+            for candidate in candidates[start:] + candidates[:start]:
+                # Check agent health
+                is_healthy = await self._check_health(candidate.agent_id, health_checks)
+                if not is_healthy:
+                    self.logger.warning(f"Agent {candidate.agent_id} is unhealthy, skipping for {analysis_type}")
+                    continue
+                
+                # Check agent capacity
+                agent_stats = self.registry.agent_status.get(candidate.agent_id, {})
+                active_tasks = agent_stats.get("active_tasks", 0)
+                max_concurrent = getattr(candidate, 'max_concurrent_tasks', 5)
+                
+                if active_tasks >= max_concurrent:
+                    self.logger.warning(f"Agent {candidate.agent_id} at capacity ({active_tasks}/{max_concurrent})")
+                    continue
+                
+                best_agent = candidate
+                break
             
-            if active_tasks >= max_concurrent:
-                self.logger.warning(f"Agent {best_agent.agent_id} at capacity ({active_tasks}/{max_concurrent})")
+            if not best_agent:
+                self.logger.warning(f"No healthy agent with capacity for {analysis_type}")
                 return None
             
             # Create enhanced task parameters
@@ -139,6 +165,31 @@ class TaskDistributor:
             self.logger.error(f"Error distributing {analysis_type} task: {e}")
             return None
     
+    async def _check_health(
+        self, 
+        agent_id: str, 
+        health_checks: Optional[Dict[str, asyncio.Task]]
+    ) -> bool:
+        """
+        Check agent health, reusing a probe already started this round
+        
+        Args:
+            agent_id: Agent identifier
+            health_checks: Probes started in this distribution round, if any
+            
+        Returns:
+            True if agent is healthy
+        """
+        if health_checks is None:
+            return await self.registry.check_agent_health(agent_id)
+        
+        check = health_checks.get(agent_id)
+        if check is None:
+            check = health_checks[agent_id] = asyncio.create_task(
+                self.registry.check_agent_health(agent_id)
+            )
+        return await asyncio.shield(check)
+    
     def get_distribution_strategy(self) -> str:
         """Get current distribution strategy"""
         return self.distribution_strategy
@@ -200,30 +251,28 @@ class TaskDistributor:
             load_info = self.get_agent_load_balance_info()
             agents = load_info.get("agents", {})
             
-            # Check for overloaded agents
-            overloaded_agents = [
-                agent_id for agent_id, info in agents.items()
-                if info["active_tasks"] > 5  # Threshold for overloaded
-            ]
+            # Categorize every agent in a single pass
+            overloaded_agents = []
+            underutilized_agents = []
+            unhealthy_agents = []
+            for agent_id, info in agents.items():
+                active_tasks = info["active_tasks"]
+                health_status = info["health_status"]
+                
+                if active_tasks > 5:  # Threshold for overloaded
+                    overloaded_agents.append(agent_id)
+                elif active_tasks == 0 and health_status == "healthy":
+                    underutilized_agents.append(agent_id)
+                
+                if health_status == "unhealthy":
+                    unhealthy_agents.append(agent_id)
             
             if overloaded_agents:
                 suggestions.append(f"Consider load balancing for overloaded agents: {', '.join(overloaded_agents)}")
             
-            # Check for underutilized agents
-            underutilized_agents = [
-                agent_id for agent_id, info in agents.items()
-                if info["active_tasks"] == 0 and info["health_status"] == "healthy"
-            ]
-            
             if underutilized_agents:
                 suggestions.append(f"Underutilized healthy agents available: {', '.join(underutilized_agents)}")
             
-            # Check for unhealthy agents
-            unhealthy_agents = [
-                agent_id for agent_id, info in agents.items()
-                if info["health_status"] == "unhealthy"
-            ]
-            
             if unhealthy_agents:
                 suggestions.append(f"Unhealthy agents need attention: {', '.join(unhealthy_agents)}")
             
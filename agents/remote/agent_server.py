@@ -11,18 +11,28 @@ import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from a2a_protocol.protocol_handler import A2AProtocolHandler
 from a2a_protocol.message_schema import (
     TaskRequest, TaskResponse, TaskStatus, AnalysisResult
 )
+from a2a_protocol.serialization import (
+    MSGPACK_CONTENT_TYPE, decode_body, encode_body, is_msgpack
+)
+from a2a_protocol.orjson_response import ORJSONResponse
+from agents.base.remote_agent import CANCEL_METHODS
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() reading as a UTC ISO timestamp"""
+    return datetime.utcfromtimestamp(ns / 1e9).isoformat()
+
+
 class AgentServer:
     """
     HTTP server for remote agents
@@ -46,7 +56,8 @@ class AgentServer:
         self.app = FastAPI(
             title=f"{agent.name} Server",
             description=f"A2A Protocol Server for {agent.name}",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         # Protocol handler for this agent
@@ -54,6 +65,8 @@ class AgentServer:
         
         # Active tasks tracking
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
+        # Running analyses by task ID, so cancel requests can stop them
+        self._analysis_tasks: Dict[str, asyncio.Task] = {}
         
         # SSE heartbeat tracking
         self._last_heartbeat = time.time()
@@ -118,13 +131,28 @@ class AgentServer:
         async def analyze_code(request: Request):
             """Handle A2A task requests"""
             try:
-                # Parse JSON-RPC request
-                request_data = await request.json()
+                # Parse JSON-RPC request (JSON or msgpack body)
+                content_type = request.headers.get("content-type")
+                request_data = decode_body(await request.body(), content_type)
                 
                 # Validate request format
                 if "method" not in request_data or "params" not in request_data:
                     raise HTTPException(status_code=400, detail="Invalid JSON-RPC request")
                 
+                if request_data["method"] in CANCEL_METHODS:
+                    params = request_data["params"] or {}
+                    task_ids = params.get("task_ids") or [params.get("task_id")]
+                    cancelled = []
+                    for task_id in task_ids:
+                        analysis = self._analysis_tasks.get(task_id)
+                        if analysis is not None and analysis.cancel():
+                            self.active_tasks[task_id]["status"] = TaskStatus.CANCELLED
+                            cancelled.append(task_id)
+                    return self._rpc_response(
+                        {"jsonrpc": "2.0", "id": request_data.get("id"), "result": {"cancelled": cancelled}},
+                        content_type
+                    )
+                
                 # Extract task parameters
                 task_params = request_data["params"]
                 task_id = request_data.get("id", f"task_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}")
@@ -134,17 +162,17 @@ class AgentServer:
                 # Track active task
                 self.active_tasks[task_id] = {
                     "status": TaskStatus.RUNNING,
-                    "started_at": datetime.utcnow(),
+                    "started_at_ns": time.time_ns(),
                     "params": task_params
                 }
                 
                 # Perform analysis using the agent
                 try:
-                    result = await self.agent.analyze_code(task_params)
+                    result = await self._run_analysis(task_id, task_params)
                     
                     # Update task status
                     self.active_tasks[task_id]["status"] = TaskStatus.COMPLETED
-                    self.active_tasks[task_id]["completed_at"] = datetime.utcnow()
+                    self.active_tasks[task_id]["completed_at_ns"] = time.time_ns()
                     self.active_tasks[task_id]["result"] = result
                     
                     # Create response
@@ -162,13 +190,29 @@ class AgentServer:
                     }
                     
                     logger.info(f"Completed analysis request {task_id}")
-                    return JSONResponse(content=response)
+                    return self._rpc_response(response, content_type)
+                    
+                except asyncio.CancelledError:
+                    # Stopped by a cancel request, not by this request ending
+                    if self.active_tasks[task_id]["status"] != TaskStatus.CANCELLED:
+                        raise
+                    
+                    logger.info(f"Cancelled analysis request {task_id}")
+                    return self._rpc_response({
+                        "jsonrpc": "2.0",
+                        "id": task_id,
+                        "error": {
+                            "code": -32000,
+                            "message": f"Task {task_id} was cancelled",
+                            "data": {"task_id": task_id}
+                        }
+                    }, content_type)
                     
                 except Exception as e:
                     # Update task status to failed
                     self.active_tasks[task_id]["status"] = TaskStatus.FAILED
                     self.active_tasks[task_id]["error"] = str(e)
-                    self.active_tasks[task_id]["failed_at"] = datetime.utcnow()
+                    self.active_tasks[task_id]["failed_at_ns"] = time.time_ns()
                     
                     error_response = {
                         "jsonrpc": "2.0",
@@ -181,7 +225,7 @@ class AgentServer:
                     }
                     
                     logger.error(f"Analysis failed for task {task_id}: {e}")
-                    return JSONResponse(content=error_response, status_code=500)
+                    return self._rpc_response(error_response, content_type, status_code=500)
                     
             except Exception as e:
                 logger.error(f"Error handling analysis request: {e}")
@@ -197,7 +241,7 @@ class AgentServer:
             return {
                 "task_id": task_id,
                 "status": task_info["status"],
-                "started_at": task_info["started_at"].isoformat(),
+                "started_at": _iso(task_info["started_at_ns"]),
                 "agent_id": self.agent.agent_id
             }
         
@@ -211,7 +255,7 @@ class AgentServer:
                     {
                         "task_id": task_id,
                         "status": task_info["status"],
-                        "started_at": task_info["started_at"].isoformat()
+                        "started_at": _iso(task_info["started_at_ns"])
                     }
                     for task_id, task_info in self.active_tasks.items()
                 ]
@@ -291,6 +335,58 @@ class AgentServer:
                 }
             )
     
+    async def _run_analysis(self, task_id: str, task_params: Dict[str, Any]) -> Any:
+        """
+        Run the agent's analysis as a task that cancel requests can stop
+        
+        Args:
+            task_id: Task identifier
+            task_params: Task parameters
+            
+        Returns:
+            Analysis result
+            
+        Raises:
+            asyncio.CancelledError: If the analysis or this request was cancelled
+        """
+        analysis = asyncio.ensure_future(self.agent.analyze_code(task_params))
+        self._analysis_tasks[task_id] = analysis
+        try:
+            await asyncio.wait((analysis,))
+        except asyncio.CancelledError:
+            analysis.cancel()
+            raise
+        finally:
+            if self._analysis_tasks.get(task_id) is analysis:
+                del self._analysis_tasks[task_id]
+        
+        return analysis.result()
+    
+    def _rpc_response(
+        self, 
+        content: Dict[str, Any], 
+        content_type: Optional[str], 
+        status_code: int = 200
+    ) -> Response:
+        """
+        Build a JSON-RPC response in the same format as the request
+        
+        Args:
+            content: Response payload
+            content_type: Content type of the incoming request
+            status_code: HTTP status code
+            
+        Returns:
+            Encoded response
+        """
+        if is_msgpack(content_type):
+            return Response(
+                content=encode_body(content, MSGPACK_CONTENT_TYPE),
+                media_type=MSGPACK_CONTENT_TYPE,
+                status_code=status_code
+            )
+        return ORJSONResponse(content=content, status_code=status_code)
+    
     async def start(self):
         """Start the agent server"""
         try:
@@ -298,7 +394,9 @@ class AgentServer:
                 self.app,
                 host=self.host,
                 port=self.port,
-                log_level="info"
+                http="httptools",
+                log_level="warning",
+                access_log=False
             )
             server = uvicorn.Server(config)
             
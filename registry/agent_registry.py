@@ -43,6 +43,9 @@ class AgentRegistry:
         self.capability_matcher = CapabilityMatcher()
         self.health_check_client = httpx.AsyncClient(timeout=5.0)
         self.health_check_task = None
+        # Bumped whenever agent membership, status or health changes so
+        # callers can tell when cached lookups are stale
+        self.revision = 0
         
         # Load initial configuration
         self._load_config()
@@ -100,6 +103,7 @@ class AgentRegistry:
             
             # Update capability matcher
             self.capability_matcher.add_agent(agent_info)
+            self.revision += 1
             
             logger.info(f"Registered agent: {agent_id} ({agent_info.name})")
             return True
@@ -129,6 +133,7 @@ class AgentRegistry:
             
             # Update capability matcher
             self.capability_matcher.remove_agent(agent_id)
+            self.revision += 1
             
             logger.info(f"Unregistered agent: {agent_id} ({agent_info.name})")
             return True
@@ -149,6 +154,19 @@ class AgentRegistry:
         """
         return self.agents.get(agent_id)
     
+    def get_many(self, agent_ids: List[str]) -> Dict[str, AgentInfo]:
+        """
+        Get information for several agents at once
+        
+        Args:
+            agent_ids: Agent identifiers
+            
+        Returns:
+            Mapping of the requested IDs that are registered to their info
+        """
+        agents = self.agents
+        return {agent_id: agents[agent_id] for agent_id in agent_ids if agent_id in agents}
+    
     def get_all_agents(self) -> List[AgentInfo]:
         """Get all registered agents"""
         return list(self.agents.values())
@@ -172,6 +190,18 @@ class AgentRegistry:
         """
         return self.capability_matcher.find_agents_by_capability(capability_name)
     
+    def find_candidates(self, required_capabilities: List[str]) -> List[AgentInfo]:
+        """
+        Find every agent that has all the given capabilities
+        
+        Args:
+            required_capabilities: List of required capability names
+            
+        Returns:
+            List of matching agents
+        """
+        return self.capability_matcher.find_agents_by_capabilities(required_capabilities)
+    
     def find_best_agent(self, required_capabilities: List[str]) -> Optional[AgentInfo]:
         """
         Find the best agent for given capabilities
@@ -209,12 +239,15 @@ class AgentRegistry:
             response_time = (datetime.utcnow() - start_time).total_seconds()
             
             is_healthy = response.status_code == 200
+            health_status = "healthy" if is_healthy else "unhealthy"
             
             # Update agent status
             if agent_id in self.agent_status:
+                if self.agent_status[agent_id]["health_status"] != health_status:
+                    self.revision += 1
                 self.agent_status[agent_id].update({
                     "last_health_check": datetime.utcnow(),
-                    "health_status": "healthy" if is_healthy else "unhealthy",
+                    "health_status": health_status,
                     "response_time": response_time,
                     "last_seen": datetime.utcnow()
                 })
@@ -227,6 +260,8 @@ class AgentRegistry:
             
             # Update status as unhealthy
             if agent_id in self.agent_status:
+                if self.agent_status[agent_id]["health_status"] != "unhealthy":
+                    self.revision += 1
                 self.agent_status[agent_id].update({
                     "last_health_check": datetime.utcnow(),
                     "health_status": "unhealthy",
@@ -284,6 +319,7 @@ class AgentRegistry:
         """
         if agent_id in self.agent_status:
             self.agent_status[agent_id]["status"] = status
+            self.revision += 1
             logger.info(f"Updated agent {agent_id} status to {status}")
     
     def increment_task_count(self, agent_id: str):
@@ -5,7 +5,7 @@ This module implements capability matching logic for the A2A agent registry.
 Matches tasks to appropriate agents based on their capabilities.
 """
 
-from typing import Dict, List, Optional, Set
+from typing import Collection, Dict, List, Optional, Set
 from collections import defaultdict
 from a2a_protocol.message_schema import AgentInfo, AgentCapability
 from utils.logger import get_logger
@@ -130,12 +130,14 @@ class CapabilityMatcher:
             logger.warning(f"No agents found with all required capabilities: {required_capabilities}")
             return None
         
-        # Score agents based on multiple factors
+        # Score agents based on multiple factors; build the required set
+        # once rather than per candidate
+        required_set = frozenset(required_capabilities)
         best_agent = None
         best_score = -1
         
         for agent in candidate_agents:
-            score = self._calculate_agent_score(agent, required_capabilities)
+            score = self._calculate_agent_score(agent, required_set)
             
             if score > best_score:
                 best_score = score
@@ -144,26 +146,28 @@ class CapabilityMatcher:
         logger.info(f"Selected best agent {best_agent.agent_id} with score {best_score}")
         return best_agent
     
-    def _calculate_agent_score(self, agent: AgentInfo, required_capabilities: List[str]) -> float:
+    def _calculate_agent_score(self, agent: AgentInfo, required_capabilities: Collection[str]) -> float:
         """
         Calculate score for agent based on capabilities and other factors
         
         Args:
             agent: Agent information
-            required_capabilities: Required capabilities
+            required_capabilities: Required capabilities, ideally already a set
             
         Returns:
             Agent score (higher is better)
         """
         score = 0.0
+        if not isinstance(required_capabilities, (set, frozenset)):
+            required_capabilities = frozenset(required_capabilities)
         
         # Base score for having required capabilities
         agent_capability_names = {cap.name for cap in agent.capabilities}
-        matching_capabilities = len(set(required_capabilities) & agent_capability_names)
+        matching_capabilities = len(required_capabilities & agent_capability_names)
         score += matching_capabilities * 10.0
         
         # Bonus for having additional relevant capabilities
-        additional_capabilities = len(agent_capability_names - set(required_capabilities))
+        additional_capabilities = len(agent_capability_names - required_capabilities)
         score += additional_capabilities * 2.0
         
         # Priority bonus (from registry config)
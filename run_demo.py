@@ -18,6 +18,8 @@ sys.path.insert(0, str(project_root))
 from registry.agent_registry import AgentRegistry
 from agents.coordinator.coordinator import CoordinatorAgent
 from agents.remote.syntax_agent import SyntaxAgent
+from a2a_protocol.event_loop import install_uvloop
+from a2a_protocol.http_client import close_http_client
 from utils.logger import setup_system_logging
 
 
@@ -175,6 +177,7 @@ class LongClass:
         
         # Cleanup
         await coordinator.stop()
+        await close_http_client()
         print("Cleanup completed")
         
     except Exception as e:
@@ -200,6 +203,7 @@ def main():
         print()
     
     # Run the demo
+    install_uvloop()
     exit_code = asyncio.run(run_demo())
     sys.exit(exit_code)
 
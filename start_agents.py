@@ -12,6 +12,7 @@ from typing import List, Dict, Any
 from multiprocessing import Process
 import uvicorn
 from utils.logger import setup_system_logging, get_logger
+from a2a_protocol.event_loop import install_uvloop
 
 # Setup logging
 setup_system_logging("INFO")
@@ -81,6 +82,7 @@ class AgentManager:
             server = AgentServer(agent, config['port'])
             
             # Run the server
+            install_uvloop()
             asyncio.run(server.start())
             
         except Exception as e:
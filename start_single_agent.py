@@ -9,6 +9,7 @@ import asyncio
 import sys
 import os
 from utils.logger import setup_system_logging, get_logger
+from a2a_protocol.event_loop import install_uvloop
 
 # Setup logging
 setup_system_logging("INFO")
@@ -93,6 +94,7 @@ def main():
     port = int(sys.argv[2]) if len(sys.argv) > 2 else default_ports.get(agent_type, 5001)
     
     # Start the agent
+    install_uvloop()
     asyncio.run(start_agent(agent_type, port))
 
 
@@ -0,0 +1,91 @@
+"""
+Client Agent Tests
+
+This module contains tests for ClientAgent dispatch and result collection.
+"""
+
+import asyncio
+import pytest
+
+from agents.base.client_agent import ClientAgent
+from a2a_protocol.message_schema import AgentInfo, TaskResponse, TaskStatus
+
+
+class FakeProtocolHandler:
+    """Stand-in protocol handler whose requests take params["delay"] seconds"""
+    
+    def __init__(self):
+        self.cancelled = []
+        self.aborted = []
+    
+    async def send_task_request(self, endpoint, params, task_id, serialization="json"):
+        try:
+            await asyncio.sleep(params["delay"])
+        except asyncio.CancelledError:
+            self.aborted.append(task_id)
+            raise
+        return TaskResponse(
+            id=task_id,
+            result={"agent_id": endpoint, "task_id": task_id, "status": "completed"}
+        )
+    
+    async def cancel_tasks(self, endpoint, task_ids):
+        self.cancelled.extend(task_ids)
+        return True
+    
+    async def close(self):
+        pass
+
+
+def _agent_info(index):
+    """Build registry info for a fake agent"""
+    return AgentInfo(
+        agent_id=f"agent-{index}",
+        name=f"Agent {index}",
+        version="1.0.0",
+        capabilities=[],
+        endpoint=f"http://agent-{index}.test"
+    )
+
+
+class TestClientAgent:
+    """Test dispatch and result collection"""
+    
+    @pytest.fixture
+    def client(self):
+        """Create a client agent with a fake protocol handler"""
+        client = ClientAgent("client-test", "Test Client")
+        client.protocol_handler = FakeProtocolHandler()
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_results_stream_and_stragglers_cancel(self, client):
+        """Results arrive in completion order and cancelling aborts in-flight requests"""
+        slow = await client._send_task_with_info(_agent_info(1), {"delay": 5}, "analyze_code")
+        fast = await client._send_task_with_info(_agent_info(2), {"delay": 0.01}, "analyze_code")
+        
+        async for task_id, result in client.iter_task_results([slow, fast], timeout=2):
+            assert task_id == fast
+            await client.cancel_remote_tasks([slow])
+            break
+        await asyncio.sleep(0)
+        
+        assert client.protocol_handler.cancelled == [slow]
+        assert client.protocol_handler.aborted == [slow]
+        assert client.get_task_status(slow).status == TaskStatus.CANCELLED
+        assert client.get_task_status(fast).status == TaskStatus.COMPLETED
+    
+    @pytest.mark.asyncio
+    async def test_repeat_and_concurrent_lookups_share_result(self, client):
+        """Every lookup of a collected task returns the same parsed result"""
+        task_id = await client._send_task_with_info(_agent_info(1), {"delay": 0.01}, "analyze_code")
+        
+        first, second = await asyncio.gather(
+            client.get_task_result(task_id),
+            client.get_task_result(task_id)
+        )
+        
+        assert first is not None
+        assert second is first
+        assert await client.get_task_result(task_id) is first
+        assert not client.pending_responses
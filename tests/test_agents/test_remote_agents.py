@@ -0,0 +1,139 @@
+"""
+Remote Agent Tests
+
+This module contains tests for remote agent request handling.
+"""
+
+import asyncio
+import httpx
+import pytest
+import pytest_asyncio
+
+from agents.base.remote_agent import RemoteAgent
+from agents.remote.agent_server import AgentServer
+from a2a_protocol.message_schema import AnalysisResult, TaskStatus
+
+
+class SlowAgent(RemoteAgent):
+    """Remote agent whose analysis takes params["delay"] seconds"""
+    
+    TASK_WORKERS = 1
+    
+    def __init__(self):
+        super().__init__("slow-agent", "Slow Agent", [], port=0)
+        # Task IDs in the order their analysis started
+        self.started = []
+    
+    async def process_task(self, task_request):
+        self.started.append(task_request.id)
+        return await super().process_task(task_request)
+    
+    async def analyze_code(self, task_params):
+        await asyncio.sleep(task_params.get("delay", 5))
+        return AnalysisResult(agent_id=self.agent_id, task_id="analysis", status=TaskStatus.COMPLETED)
+
+
+def _client(app):
+    """Build an HTTP client that calls the app in-process"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://agent.test")
+
+
+def _task_request(task_id, **params):
+    """Build a JSON-RPC analysis request"""
+    return {"jsonrpc": "2.0", "id": task_id, "method": "analyze_code", "params": {"code": "x = 1", **params}}
+
+
+def _cancel_request(*task_ids):
+    """Build a JSON-RPC batch cancel request"""
+    return {"jsonrpc": "2.0", "id": "cancel", "method": "cancel_tasks", "params": {"task_ids": list(task_ids)}}
+
+
+@pytest_asyncio.fixture
+async def agent():
+    """Create a slow agent, served without start(), and stop its workers afterwards"""
+    agent = SlowAgent()
+    yield agent
+    await agent.stop()
+
+
+class TestTaskQueue:
+    """Test the priority task queue behind /analyze"""
+    
+    @pytest.mark.asyncio
+    async def test_tasks_run_by_priority(self, agent):
+        """Queued tasks start lowest priority value first, FIFO among equals"""
+        async with _client(agent.app) as client:
+            blocker = asyncio.create_task(client.post("/analyze", json=_task_request("blocker", delay=0.1)))
+            await asyncio.sleep(0.05)
+            
+            requests = [
+                asyncio.create_task(client.post("/analyze", json=_task_request(task_id, delay=0, priority=priority)))
+                for task_id, priority in [("low", 9), ("high-1", 1), ("high-2", 1)]
+            ]
+            await asyncio.sleep(0.01)
+            responses = await asyncio.gather(blocker, *requests)
+        
+        assert all(response.json()["error"] is None for response in responses)
+        assert agent.started == ["blocker", "high-1", "high-2", "low"]
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_429(self, agent):
+        """Requests beyond the queue's capacity are rejected"""
+        agent._task_queue = asyncio.PriorityQueue(maxsize=1)
+        
+        async with _client(agent.app) as client:
+            running = asyncio.create_task(client.post("/analyze", json=_task_request("running")))
+            await asyncio.sleep(0.05)
+            queued = asyncio.create_task(client.post("/analyze", json=_task_request("queued")))
+            await asyncio.sleep(0.05)
+            
+            response = await client.post("/analyze", json=_task_request("rejected"))
+            assert response.status_code == 429
+            
+            await client.post("/analyze", json=_cancel_request("running", "queued"))
+            await asyncio.gather(running, queued)
+    
+    @pytest.mark.asyncio
+    async def test_timeout_returns_error_message(self, agent):
+        """A task that outlives TASK_TIMEOUT gets an explicit error"""
+        agent.TASK_TIMEOUT = 0.05
+        
+        async with _client(agent.app) as client:
+            response = await client.post("/analyze", json=_task_request("slow"))
+        
+        assert "timed out" in response.json()["error"]["message"]
+        assert list(agent.dead_letters) == ["slow"]
+
+
+class TestCancellation:
+    """Test that cancel requests stop the work they report"""
+    
+    @pytest.mark.asyncio
+    async def test_remote_agent_cancels_running_task(self, agent):
+        """A running task is stopped and its request answered with an error"""
+        async with _client(agent.app) as client:
+            analysis = asyncio.create_task(client.post("/analyze", json=_task_request("task-1")))
+            await asyncio.sleep(0.1)
+            
+            reply = await client.post("/analyze", json=_cancel_request("task-1", "unknown"))
+            assert reply.json()["result"] == {"cancelled": ["task-1"]}
+            
+            response = await asyncio.wait_for(analysis, 1)
+            assert "cancelled" in response.json()["error"]["message"]
+            assert agent.get_task_status("task-1").status == TaskStatus.CANCELLED
+    
+    @pytest.mark.asyncio
+    async def test_agent_server_cancels_running_analysis(self):
+        """A running analysis is stopped and keeps its cancelled status"""
+        server = AgentServer(SlowAgent(), port=0)
+        
+        async with _client(server.app) as client:
+            analysis = asyncio.create_task(client.post("/analyze", json=_task_request("task-1")))
+            await asyncio.sleep(0.1)
+            
+            reply = await client.post("/analyze", json=_cancel_request("task-1", "unknown"))
+            assert reply.json()["result"] == {"cancelled": ["task-1"]}
+            
+            response = await asyncio.wait_for(analysis, 1)
+            assert "cancelled" in response.json()["error"]["message"]
+            assert server.active_tasks["task-1"]["status"] == TaskStatus.CANCELLED
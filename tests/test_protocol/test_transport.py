@@ -0,0 +1,88 @@
+"""
+Transport Tests
+
+This module contains tests for the A2A transport circuit breaker.
+"""
+
+import time
+import asyncio
+import pytest
+import pytest_asyncio
+
+from a2a_protocol.message_schema import TaskRequest
+from a2a_protocol.transport import (
+    A2ATransport, TransportError, BREAKER_OPEN, BREAKER_HALF_OPEN
+)
+
+ENDPOINT = "http://agent.test/analyze"
+
+
+class HangingClient:
+    """Stand-in HTTP client whose requests never complete"""
+    
+    def __init__(self):
+        self.started = asyncio.Event()
+    
+    async def post(self, *args, **kwargs):
+        self.started.set()
+        await asyncio.Event().wait()
+    
+    async def aclose(self):
+        pass
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions"""
+    
+    @pytest_asyncio.fixture
+    async def transport(self):
+        """Create transport with a tripped breaker whose cooldown has passed"""
+        transport = A2ATransport(max_retries=0)
+        transport.breaker_cooldown = 30.0
+        transport._breakers[ENDPOINT] = {
+            "state": BREAKER_OPEN,
+            "failures": transport.breaker_threshold,
+            "opened_at": time.monotonic() - transport.breaker_cooldown - 1
+        }
+        yield transport
+        await transport.close()
+    
+    def _message(self):
+        """Build a minimal task request"""
+        return TaskRequest(id="task-1", method="analyze_code", params={"code": "x = 1"})
+    
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self, transport):
+        """An open breaker inside its cooldown rejects requests"""
+        transport._breakers[ENDPOINT]["opened_at"] = time.monotonic()
+        
+        with pytest.raises(TransportError, match="Circuit open"):
+            await transport.send_message(ENDPOINT, self._message())
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_reopens_breaker(self, transport):
+        """Cancelling the half-open probe returns the breaker to open"""
+        client = HangingClient()
+        transport.client = client
+        
+        probe = asyncio.create_task(transport.send_message(ENDPOINT, self._message()))
+        await client.started.wait()
+        assert transport._breakers[ENDPOINT]["state"] == BREAKER_HALF_OPEN
+        
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        
+        breaker = transport._breakers[ENDPOINT]
+        assert breaker["state"] == BREAKER_OPEN
+        assert time.monotonic() - breaker["opened_at"] < transport.breaker_cooldown
+        
+        # Once the new cooldown passes, another probe is allowed through
+        breaker["opened_at"] = time.monotonic() - transport.breaker_cooldown - 1
+        client.started.clear()
+        probe = asyncio.create_task(transport.send_message(ENDPOINT, self._message()))
+        await client.started.wait()
+        assert transport._breakers[ENDPOINT]["state"] == BREAKER_HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
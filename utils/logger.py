@@ -156,13 +156,47 @@ class A2ALogger:
         self.error(f"Task failed: {task_id} - {error}", 
                   task_id=task_id, error=error)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at level would be emitted"""
+        return self.logger.isEnabledFor(level)
+    
     def log_protocol_message(self, message_type: str, target: str, direction: str):
         """Log A2A protocol message"""
+        # Skip formatting and the extra dict when debug output is off
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.debug(f"Protocol message: {direction} {message_type} to {target}", 
                   message_type=message_type, target=target, direction=direction)
     
     def log_agent_communication(self, target_agent: str, operation: str, success: bool):
         """Log agent communication"""
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
         status = "success" if success else "failed"
-        self.info(f"Agent communication: {operation} with {target_agent} - {status}", 
-                 target_agent=target_agent, operation=operation, success=success)
+        self.logger.log(level, f"Agent communication: {operation} with {target_agent} - {status}", 
+                        extra={"target_agent": target_agent, "operation": operation, "success": success})
+    
+    def log_dispatch(self, task_id: Optional[str], target_agent: str, success: bool, error: Optional[str] = None):
+        """
+        Log a task dispatch to a remote agent as a single record
+        
+        Args:
+            task_id: Local task identifier, if one was created
+            target_agent: Agent the task was sent to
+            success: Whether the send succeeded
+            error: Error message for a failed send
+        """
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+        if success:
+            message = f"Dispatched task {task_id} to {target_agent}"
+        else:
+            message = f"Failed to send task {task_id} to agent {target_agent}: {error}"
+        self.logger.log(level, message, extra={
+            "task_id": task_id,
+            "target_agent": target_agent,
+            "operation": "send_task",
+            "success": success
+        })